@@ -89,22 +89,16 @@ def setup_hourly_schedule():
         result = subprocess.run(['crontab', '-l'], capture_output=True, text=True)
         current_crontab = result.stdout
         
-        # 移除旧的推送任务
-        lines = current_crontab.split('\n')
-        new_lines = []
-        
-        for line in lines:
-            if 'auto_stock_notifier' not in line and 'hourly_pusher' not in line:
-                new_lines.append(line)
-        
-        # 添加新任务
+        # 移除旧的推送任务和空行，添加新任务（crontab要求以换行结尾）
+        new_lines = [
+            line for line in current_crontab.splitlines()
+            if line and 'auto_stock_notifier' not in line and 'hourly_pusher' not in line
+        ]
         new_lines.append(cron_command)
-        new_crontab = '\n'.join(filter(None, new_lines))
+        new_crontab = '\n'.join(new_lines) + '\n'
         
-        # 写入新crontab
-        with subprocess.Popen(['crontab', '-'], stdin=subprocess.PIPE, text=True) as proc:
-            proc.stdin.write(new_crontab)
-            proc.stdin.close()
+        # 一次调用写入新crontab，失败时抛出CalledProcessError
+        subprocess.run(['crontab', '-'], input=new_crontab, text=True, check=True)
         
         print("✅ 定时推送计划设置完成")
         print(f"任务内容: {cron_command}")
@@ -3,9 +3,17 @@ Situation-Monitor 智能监控系统
 基于情境感知的实时监控、智能告警和自动化修复系统
 """
 
+import os
+import sys
+
 __version__ = "1.0.0"
 __author__ = "智能新闻推送系统团队"
 
+# 将src目录加入路径（只在包导入时执行一次），以便各子模块导入utils等现有模块
+_SRC_DIR = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+if _SRC_DIR not in sys.path:
+    sys.path.insert(0, _SRC_DIR)
+
 from .core.monitor import SituationMonitor, Check, CheckResult, Alert, CheckStatus, AlertLevel
 
 # 导出主要组件
@@ -262,7 +262,7 @@ class AlertEscalationManager:
                 state=AlertState.NEW,
                 escalation_level=self.severity_to_base_level.get(alert.level, 0),
                 count=1,
-                context=alert.context
+                context=alert.get_context()
             )
             
             self.alerts[alert_id] = new_alert
@@ -40,17 +40,25 @@ class AlertManager:
         # 已静音的告警源
         self.muted_sources: Set[str] = set()
         
-        # 告警统计
-        self.stats = {
-            "alerts_processed": 0,
-            "alerts_escalated": 0,
-            "notifications_sent": 0,
-            "last_processed": None
-        }
+        # 告警统计（使用普通整数属性，get_statistics时再组装成字典）
+        self._n_processed = 0
+        self._n_escalated = 0
+        self._n_notified = 0
+        self._last_processed: Optional[datetime] = None
         
         # 告警过滤器
         self.alert_filters = []
     
+    @property
+    def stats(self) -> Dict[str, Any]:
+        """管理器自身的计数统计（只读视图，兼容原有的stats字典）"""
+        return {
+            "alerts_processed": self._n_processed,
+            "alerts_escalated": self._n_escalated,
+            "notifications_sent": self._n_notified,
+            "last_processed": self._last_processed
+        }
+    
     def register_notification_callback(self, callback: Callable[[Alert], None]):
         """
         注册通知回调
@@ -81,8 +89,8 @@ class AlertManager:
             处理后的告警记录
         """
         # 更新统计
-        self.stats["alerts_processed"] += 1
-        self.stats["last_processed"] = datetime.now()
+        self._n_processed += 1
+        self._last_processed = datetime.now()
         
         # 检查是否静音
         if alert.source in self.muted_sources:
@@ -101,7 +109,7 @@ class AlertManager:
         
         # 检查是否需要升级
         if alert_record.escalation_level > 0:
-            self.stats["alerts_escalated"] += 1
+            self._n_escalated += 1
             
             # 生成升级后的告警
             escalated_alert = alert_record.to_situation_alert()
@@ -133,7 +141,7 @@ class AlertManager:
         for callback in self.notification_callbacks:
             try:
                 callback(alert)
-                self.stats["notifications_sent"] += 1
+                self._n_notified += 1
             except Exception as e:
                 print(f"告警通知回调执行失败: {e}")
     
@@ -6,6 +6,8 @@
 
 import sys
 import os
+import json
+import weakref
 from datetime import datetime
 from typing import Dict, List, Any, Optional, Callable
 from dataclasses import dataclass
@@ -21,6 +23,16 @@ except ImportError:
     WHATSAPP_AVAILABLE = False
     print("警告: WhatsApp消息发送模块不可用，WhatsApp通知将不可用")
 
+# 尝试导入orjson（可选，直接输出UTF-8字节，比json快）
+try:
+    import orjson
+    ORJSON_AVAILABLE = True
+except ImportError:
+    ORJSON_AVAILABLE = False
+
+# 默认WhatsApp收件人号码
+DEFAULT_WHATSAPP_NUMBER = "+8618966719971"
+
 
 @dataclass
 class NotificationConfig:
@@ -62,6 +74,10 @@ class AlertNotifier:
         
         # 自定义通知处理器
         self.custom_handlers: List[Callable[[Alert], None]] = []
+        
+        # 告警日志文件句柄（首次写入时以二进制追加模式打开，之后复用）
+        self._log_fh = None
+        self._log_finalizer: Optional[weakref.finalize] = None
     
     def should_send_notification(self, alert: Alert) -> bool:
         """
@@ -184,17 +200,16 @@ class AlertNotifier:
                 "source": alert.source,
                 "title": alert.title,
                 "message": alert.message,
-                "context": alert.context
+                "context": alert.get_context()
             }
             
-            import json
-            log_line = json.dumps(log_entry, ensure_ascii=False)
+            if ORJSON_AVAILABLE:
+                log_line = orjson.dumps(log_entry, default=str, option=orjson.OPT_APPEND_NEWLINE)
+            else:
+                log_line = (json.dumps(log_entry, ensure_ascii=False, default=str) + '\n').encode('utf-8')
             
-            # 确保目录存在
-            os.makedirs(os.path.dirname(self.config.file_path), exist_ok=True)
-            
-            with open(self.config.file_path, 'a', encoding='utf-8') as f:
-                f.write(log_line + '\n')
+            self._get_log_file().write(log_line)
+            self._log_fh.flush()
             
             return True
             
@@ -202,6 +217,24 @@ class AlertNotifier:
             print(f"文件通知失败: {e}")
             return False
     
+    def _get_log_file(self):
+        """获取告警日志文件句柄，首次调用时创建目录并打开文件"""
+        if self._log_fh is None:
+            log_dir = os.path.dirname(self.config.file_path)
+            if log_dir:
+                os.makedirs(log_dir, exist_ok=True)
+            self._log_fh = open(self.config.file_path, 'ab')
+            # 未显式调用close()时，在通知器被回收或进程退出时关闭文件
+            self._log_finalizer = weakref.finalize(self, self._log_fh.close)
+        return self._log_fh
+    
+    def close(self):
+        """关闭告警日志文件句柄"""
+        if self._log_fh is not None:
+            self._log_finalizer()
+            self._log_fh = None
+            self._log_finalizer = None
+    
     def _send_to_whatsapp(self, alert: Alert) -> bool:
         """发送到WhatsApp"""
         if not WHATSAPP_AVAILABLE:
@@ -229,12 +262,7 @@ class AlertNotifier:
 
 {alert.message[:200]}{'...' if len(alert.message) > 200 else ''}
 """
-            # 发送消息
-            recipient = self.config.whatsapp_recipient
-            if not recipient:
-                # 使用默认收件人
-                recipient = os.getenv("WHATSAPP_NUMBER", "+8618966719971")  # 默认号码
-            
+            # 发送消息（收件人由message_sender按其配置确定）
             success = send_whatsapp_message(whatsapp_message.strip())
             return success
             
@@ -322,7 +350,7 @@ ID: {alert.alert_id}
 {alert.message}
 
 上下文:
-{alert.context if alert.context else "无"}
+{alert.get_context() or "无"}
 {"=" * 40}
 """.strip()
         
@@ -363,7 +391,7 @@ def create_default_notifier() -> AlertNotifier:
         enable_file=True,
         enable_whatsapp=True,
         file_path="./logs/alerts.log",
-        whatsapp_recipient=os.getenv("WHATSAPP_NUMBER", "+8618966719971"),
+        whatsapp_recipient=os.getenv("WHATSAPP_NUMBER", DEFAULT_WHATSAPP_NUMBER),
         min_severity_for_whatsapp=AlertLevel.WARNING,  # 只发送warning及以上到WhatsApp
         cooldown_seconds=300  # 5分钟冷却
     )
@@ -0,0 +1,107 @@
+#!/usr/bin/env python3
+"""
+网络探测检查
+基于asyncio在监控器的事件循环中并发探测多个端点
+"""
+
+import time
+import asyncio
+from datetime import datetime
+from typing import Dict, List, Any, Optional, Tuple
+import logging
+
+# 导入situation-monitor核心类型
+from ..core.monitor import AsyncCheck, CheckResult, CheckStatus
+
+logger = logging.getLogger(__name__)
+
+# 单个端点的连接超时时间（秒）
+PROBE_TIMEOUT = 3
+
+
+class TcpProbeCheck(AsyncCheck):
+    """TCP连通性检查（所有端点并发探测，总耗时约等于最慢的一个）"""
+    
+    def __init__(self, check_id: str, check_name: str, endpoints: List[Tuple[str, int]],
+                 timeout: float = PROBE_TIMEOUT, interval_seconds: int = 60):
+        """
+        初始化TCP连通性检查
+        
+        Args:
+            check_id: 检查ID
+            check_name: 检查名称
+            endpoints: 需要探测的(主机, 端口)列表
+            timeout: 单个端点的连接超时时间（秒）
+            interval_seconds: 检查间隔（秒）
+        """
+        super().__init__(check_id, check_name, interval_seconds=interval_seconds)
+        self.endpoints = list(endpoints)
+        self.timeout = timeout
+        self.add_tag("network")
+    
+    async def _probe(self, host: str, port: int) -> Tuple[bool, float, Optional[str]]:
+        """
+        探测单个端点
+        
+        Returns:
+            (是否可达, 耗时毫秒, 错误信息)
+        """
+        start_ns = time.monotonic_ns()
+        try:
+            _, writer = await asyncio.wait_for(asyncio.open_connection(host, port), self.timeout)
+        except asyncio.TimeoutError:
+            return False, (time.monotonic_ns() - start_ns) / 1_000_000, "连接超时"
+        except OSError as e:
+            return False, (time.monotonic_ns() - start_ns) / 1_000_000, str(e)
+        
+        latency_ms = (time.monotonic_ns() - start_ns) / 1_000_000
+        writer.close()
+        try:
+            await writer.wait_closed()
+        except OSError:
+            pass
+        return True, latency_ms, None
+    
+    async def execute_async(self) -> CheckResult:
+        """并发探测所有端点"""
+        now = datetime.now()
+        start_ns = time.monotonic_ns()
+        
+        results = await asyncio.gather(*(self._probe(host, port) for host, port in self.endpoints))
+        
+        endpoints: Dict[str, Dict[str, Any]] = {}
+        failed = []
+        for (host, port), (reachable, latency_ms, error) in zip(self.endpoints, results):
+            name = f"{host}:{port}"
+            endpoints[name] = {
+                "reachable": reachable,
+                "latency_ms": round(latency_ms, 1),
+                "error": error
+            }
+            if not reachable:
+                failed.append(name)
+        
+        total = len(self.endpoints)
+        if not failed:
+            status = CheckStatus.HEALTHY
+            message = f"全部{total}个端点可达"
+        elif len(failed) == total:
+            status = CheckStatus.ERROR
+            message = f"全部{total}个端点不可达"
+        else:
+            status = CheckStatus.WARNING
+            message = f"{len(failed)}/{total}个端点不可达: {', '.join(failed)}"
+        
+        return CheckResult(
+            check_id=self.check_id,
+            check_name=self.check_name,
+            status=status,
+            message=message,
+            metrics={
+                "endpoints": endpoints,
+                "reachable_count": total - len(failed),
+                "total_count": total
+            },
+            timestamp=now,
+            duration_ms=(time.monotonic_ns() - start_ns) / 1_000_000
+        )
@@ -5,62 +5,242 @@
 """
 
 import os
+import re
 import sys
 import time
 import sqlite3
-import requests
+import platform
+import threading
+from collections import deque
+from concurrent.futures import ThreadPoolExecutor, as_completed, TimeoutError as FuturesTimeoutError
 from datetime import datetime
+from urllib.parse import quote
 from typing import Dict, List, Any, Optional
 import logging
 
-# 添加父目录到路径以便导入现有模块
-sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.dirname(os.path.abspath(__file__)))))
+# 导入situation-monitor核心类型
+try:
+    from ..core.monitor import Check, CheckResult, CheckStatus, ProbeRunner
+except ImportError:
+    # 作为脚本直接运行时没有父包，把src目录加入路径后使用绝对导入
+    sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.dirname(os.path.abspath(__file__)))))
+    from situation_monitor.core.monitor import Check, CheckResult, CheckStatus, ProbeRunner
 
+# psutil为可选依赖，在模块加载时导入一次
 try:
-    from situation_monitor.core.monitor import Check, CheckResult, CheckStatus
-    from utils.database import NewsDatabase
-    from utils.config import ConfigManager
-    from utils.logger import Logger
-    from utils.message_sender import send_whatsapp_message
-except ImportError as e:
-    print(f"[SystemChecks] 导入模块失败: {e}")
-    # 创建简单的替代类
-    class NewsDatabase:
-        def __init__(self, db_path=None):
-            self.db_path = db_path or "./news_cache.db"
+    import psutil
+    PSUTIL_AVAILABLE = True
+except ImportError:
+    PSUTIL_AVAILABLE = False
+
+logger = logging.getLogger(__name__)
+
+# 需要检查使用率的本地块设备文件系统（跳过tmpfs、overlay、nfs等）
+LOCAL_FSTYPES = frozenset({"ext4", "ext3", "xfs", "btrfs", "zfs", "apfs", "ntfs"})
+
+# 单个分区disk_usage的超时时间（秒），防止失效的挂载点阻塞整个检查
+DISK_USAGE_TIMEOUT = 0.5
+
+# 分区disk_usage在守护线程中执行（按挂载点，同一挂载点同时最多一个），挂起的statvfs不会阻止进程退出
+_DISK_PROBES = ProbeRunner("disk-usage")
+
+# 单个消息平台探测的超时时间（秒）
+PLATFORM_CHECK_TIMEOUT = 5
+
+# 消息平台探测在守护线程中执行（每个平台同时最多一个），挂起的探测不会阻止进程退出
+_PLATFORM_PROBES = ProbeRunner("platform-probe")
+
+# 资源阈值表：(指标键, 警告阈值, 严重阈值, 警告描述, 严重描述)
+THRESHOLDS = (
+    ("cpu_percent", 80, 90, "CPU使用率偏高", "CPU使用率极高"),
+    ("memory_percent", 85, 95, "内存使用率偏高", "内存使用率极高"),
+    ("disk_percent", 90, 95, "磁盘空间紧张", "磁盘空间严重不足"),
+)
+
+
+def _disk_usage(path: str) -> tuple:
+    """
+    获取磁盘使用情况，POSIX系统直接调用os.statvfs（计算方式与psutil.disk_usage一致）
+    
+    Args:
+        path: 挂载点或目录路径
         
-        def test_connection(self) -> bool:
-            try:
-                conn = sqlite3.connect(self.db_path)
-                cursor = conn.cursor()
-                cursor.execute("SELECT 1")
-                result = cursor.fetchone()
-                conn.close()
-                return result[0] == 1 if result else False
-            except:
-                return False
-    
-    class ConfigManager:
-        def __init__(self, config_dir="config"):
-            self.config_dir = config_dir
-    
-    class Logger:
-        def __init__(self, name):
-            self.name = name
+    Returns:
+        (总字节数, 可用字节数, 使用率百分比)
+    """
+    if not hasattr(os, "statvfs"):
+        usage = psutil.disk_usage(path)
+        return usage.total, usage.free, usage.percent
+    
+    st = os.statvfs(path)
+    total = st.f_blocks * st.f_frsize
+    used = total - st.f_bfree * st.f_frsize
+    free = st.f_bavail * st.f_frsize
+    total_user = used + free
+    percent = round(used / total_user * 100, 1) if total_user else 0.0
+    return total, free, percent
+
+
+def _evaluate_thresholds(values: Dict[str, float]) -> tuple:
+    """
+    按阈值表评估资源指标
+    
+    Args:
+        values: 指标键到百分比的映射，缺少的指标会被跳过
         
-        def info(self, msg):
-            print(f"[{self.name}] INFO: {msg}")
+    Returns:
+        (严重问题列表, 警告列表)
+    """
+    criticals = []
+    warnings = []
+    for key, warn, crit, warn_label, crit_label in THRESHOLDS:
+        value = values.get(key)
+        if value is None:
+            continue
+        if value > crit:
+            criticals.append(f"{crit_label}: {value}%")
+        elif value > warn:
+            warnings.append(f"{warn_label}: {value}%")
+    return criticals, warnings
+
+
+class _LinuxProcReader:
+    """
+    直接读取/proc下的文件获取内存和CPU指标（仅Linux）
+    避免psutil构造namedtuple的开销，输出与psutil一致
+    """
+    
+    _MEMINFO_RE = re.compile(rb'(\w+):\s+(\d+)')
+    
+    def __init__(self):
+        self._last_cpu_times: Optional[tuple] = None
+    
+    @staticmethod
+    def available() -> bool:
+        """当前系统是否支持/proc读取"""
+        return sys.platform.startswith("linux") and os.path.exists("/proc/meminfo")
+    
+    def meminfo(self) -> Dict[str, int]:
+        """读取/proc/meminfo，返回字段名到字节数的映射"""
+        with open("/proc/meminfo", "rb") as f:
+            buf = f.read()
+        return {k.decode(): int(v) * 1024 for k, v in self._MEMINFO_RE.findall(buf)}
+    
+    def virtual_memory(self) -> Dict[str, float]:
+        """内存总量、已用量和使用率（与psutil.virtual_memory计算方式一致）"""
+        mem = self.meminfo()
+        total = mem["MemTotal"]
+        available = mem.get("MemAvailable", mem.get("MemFree", 0))
+        used = total - available
+        return {
+            "total": total,
+            "used": used,
+            "percent": round(used / total * 100, 1) if total else 0.0
+        }
+    
+    def _read_cpu_times(self) -> tuple:
+        """读取/proc/stat第一行，返回(总jiffies, 空闲jiffies)"""
+        with open("/proc/stat", "rb") as f:
+            fields = [int(v) for v in f.readline().split()[1:9]]
+        # idle + iowait 视为空闲；guest时间已包含在user/nice中，不重复计算
+        idle = fields[3] + (fields[4] if len(fields) > 4 else 0)
+        return sum(fields), idle
+    
+    def cpu_percent(self, interval: float = 0.1) -> float:
+        """
+        CPU使用率（相对上一次调用的jiffies差值）
+        首次调用时采样interval秒，之后不再阻塞
+        """
+        if self._last_cpu_times is None:
+            self._last_cpu_times = self._read_cpu_times()
+            time.sleep(interval)
         
-        def error(self, msg):
-            print(f"[{self.name}] ERROR: {msg}")
+        total, idle = self._read_cpu_times()
+        last_total, last_idle = self._last_cpu_times
+        self._last_cpu_times = (total, idle)
         
-        def warning(self, msg):
-            print(f"[{self.name}] WARNING: {msg}")
+        delta_total = total - last_total
+        if delta_total <= 0:
+            return 0.0
+        busy = delta_total - (idle - last_idle)
+        return round(min(100.0, max(0.0, busy / delta_total * 100)), 1)
 
-logger = logging.getLogger(__name__)
+
+class _CpuSampler:
+    """
+    后台CPU采样器
+    守护线程每秒采样一次每核使用率，检查时直接读取最新样本而不阻塞
+    """
+    
+    _samples: deque = deque(maxlen=60)  # 最近60秒的每核使用率
+    _thread: Optional[threading.Thread] = None
+    _lock = threading.Lock()
+    
+    @classmethod
+    def _run(cls):
+        while True:
+            cls._samples.append(psutil.cpu_percent(interval=1.0, percpu=True))
+    
+    @classmethod
+    def _ensure_started(cls):
+        with cls._lock:
+            if cls._thread is None:
+                cls._thread = threading.Thread(target=cls._run, name="cpu-sampler", daemon=True)
+                cls._thread.start()
+    
+    @classmethod
+    def get(cls) -> List[float]:
+        """
+        获取最新的每核CPU使用率
+        采样线程尚未产出样本时（首次调用），阻塞采样0.1秒
+        """
+        cls._ensure_started()
+        if cls._samples:
+            return cls._samples[-1]
+        return psutil.cpu_percent(interval=0.1, percpu=True)
+    
+    @classmethod
+    def window_stats(cls) -> Dict[str, Optional[float]]:
+        """采样窗口内整体CPU使用率的平均值和最大值"""
+        totals = [sum(sample) / len(sample) for sample in list(cls._samples) if sample]
+        if not totals:
+            return {"avg": None, "max": None}
+        return {"avg": round(sum(totals) / len(totals), 1), "max": round(max(totals), 1)}
+
+
+class CachedCheck(Check):
+    """
+    带结果缓存的检查基类
+    在interval_seconds内重复调用execute时直接返回上次结果（同一对象，时间戳为实际检查时间），
+    监控器据此识别缓存命中，不会重复记录；子类实现_do_execute
+    """
+    
+    def __init__(self, check_id: str, check_name: str, interval_seconds: int = 60):
+        super().__init__(check_id, check_name, interval_seconds)
+        self._last_result: Optional[CheckResult] = None
+        self._last_ts: float = 0.0
+    
+    def execute(self) -> CheckResult:
+        """执行检查，缓存未过期时返回上次结果"""
+        now = time.monotonic()
+        if self._last_result is not None and now - self._last_ts < self.interval_seconds:
+            return self._last_result
+        
+        result = self._do_execute()
+        self._last_result, self._last_ts = result, now
+        return result
+    
+    def _do_execute(self) -> CheckResult:
+        """
+        实际执行检查（子类必须实现）
+        
+        Returns:
+            检查结果
+        """
+        raise NotImplementedError("子类必须实现 _do_execute 方法")
 
 
-class DatabaseCheck(Check):
+class DatabaseCheck(CachedCheck):
     """数据库连接检查"""
     
     def __init__(self, db_path: str = None):
@@ -74,20 +254,65 @@ class DatabaseCheck(Check):
         self.db_path = db_path or "./news_cache.db"
         self.add_tag("database")
         self.add_tag("essential")
+        
+        # 长连接（首次检查时建立，出错时关闭并在下次检查时重连）
+        self._conn: Optional[sqlite3.Connection] = None
+        self._lock = threading.Lock()
     
-    def execute(self) -> CheckResult:
+    def _get_connection(self) -> sqlite3.Connection:
+        """
+        获取数据库长连接，不存在时创建（调用方需持有self._lock）
+        以只读方式打开，健康检查不修改被监控的数据库（如journal_mode等持久设置）
+        """
+        if self._conn is None:
+            uri = f"file:{quote(os.path.abspath(self.db_path))}?mode=ro"
+            conn = sqlite3.connect(uri, uri=True, check_same_thread=False, isolation_level=None)
+            conn.execute("PRAGMA cache_size=-64000")
+            self._conn = conn
+        return self._conn
+    
+    def _query_one(self) -> Optional[tuple]:
+        """通过长连接执行SELECT 1，出错时关闭连接以便下次重连"""
+        with self._lock:
+            try:
+                return self._get_connection().execute("SELECT 1").fetchone()
+            except sqlite3.Error:
+                self._close_locked()
+                raise
+    
+    def _close_locked(self):
+        """关闭长连接（调用方需持有self._lock）"""
+        if self._conn is not None:
+            try:
+                self._conn.close()
+            except sqlite3.Error:
+                pass
+            self._conn = None
+    
+    def close(self):
+        """释放数据库长连接"""
+        with self._lock:
+            self._close_locked()
+    
+    def _do_execute(self) -> CheckResult:
         """执行数据库连接检查"""
+        now = datetime.now()
         try:
-            start_time = time.time()
+            start_ns = time.monotonic_ns()
+            
+            # 只stat一次数据库文件，同时得到是否存在、大小和修改时间
+            db_stat = None
+            if self.db_path:
+                try:
+                    db_stat = os.stat(self.db_path)
+                except OSError:
+                    db_stat = None
+            db_exists = db_stat is not None
             
             # 测试数据库连接
-            if self.db_path and os.path.exists(self.db_path):
+            if db_exists:
                 try:
-                    conn = sqlite3.connect(self.db_path)
-                    cursor = conn.cursor()
-                    cursor.execute("SELECT 1")
-                    result = cursor.fetchone()
-                    conn.close()
+                    result = self._query_one()
                     
                     if result and result[0] == 1:
                         status = CheckStatus.HEALTHY
@@ -102,7 +327,7 @@ class DatabaseCheck(Check):
                 status = CheckStatus.WARNING
                 message = f"数据库文件不存在: {self.db_path}"
             
-            duration_ms = (time.time() - start_time) * 1000
+            duration_ms = (time.monotonic_ns() - start_ns) / 1_000_000
             
             return CheckResult(
                 check_id=self.check_id,
@@ -111,9 +336,11 @@ class DatabaseCheck(Check):
                 message=message,
                 metrics={
                     "db_path": self.db_path,
-                    "file_exists": os.path.exists(self.db_path) if self.db_path else False
+                    "file_exists": db_exists,
+                    "file_size_bytes": db_stat.st_size if db_exists else None,
+                    "modified_at": datetime.fromtimestamp(db_stat.st_mtime).isoformat() if db_exists else None
                 },
-                timestamp=datetime.now(),
+                timestamp=now,
                 duration_ms=duration_ms
             )
             
@@ -124,12 +351,12 @@ class DatabaseCheck(Check):
                 status=CheckStatus.ERROR,
                 message=f"数据库检查异常: {str(e)}",
                 metrics={},
-                timestamp=datetime.now(),
+                timestamp=now,
                 duration_ms=0
             )
 
 
-class MessagePlatformCheck(Check):
+class MessagePlatformCheck(CachedCheck):
     """消息平台可用性检查"""
     
     def __init__(self):
@@ -138,16 +365,18 @@ class MessagePlatformCheck(Check):
         self.add_tag("messaging")
         self.add_tag("essential")
     
-    def execute(self) -> CheckResult:
+    def _do_execute(self) -> CheckResult:
         """执行消息平台检查"""
+        now = datetime.now()
+        now_iso = now.isoformat()
         try:
-            start_time = time.time()
+            start_ns = time.monotonic_ns()
             
-            # 检查WhatsApp连接
-            whatsapp_status = self._check_whatsapp()
-            
-            # 检查微信连接（如果配置了）
-            wechat_status = self._check_wechat()
+            # 并发检查WhatsApp和微信连接（总耗时取决于最慢的平台）
+            whatsapp_future = _PLATFORM_PROBES.submit("whatsapp", self._check_whatsapp, now_iso)
+            wechat_future = _PLATFORM_PROBES.submit("wechat", self._check_wechat, now_iso)
+            whatsapp_status = self._platform_result(whatsapp_future, "WhatsApp", now_iso)
+            wechat_status = self._platform_result(wechat_future, "微信", now_iso)
             
             # 确定整体状态
             # WhatsApp是核心消息平台，微信是可选功能
@@ -164,7 +393,7 @@ class MessagePlatformCheck(Check):
                 status = CheckStatus.ERROR
                 message = "消息平台连接异常"
             
-            duration_ms = (time.time() - start_time) * 1000
+            duration_ms = (time.monotonic_ns() - start_ns) / 1_000_000
             
             return CheckResult(
                 check_id=self.check_id,
@@ -176,7 +405,7 @@ class MessagePlatformCheck(Check):
                     "wechat": wechat_status,
                     "platforms_checked": ["whatsapp", "wechat"]
                 },
-                timestamp=datetime.now(),
+                timestamp=now,
                 duration_ms=duration_ms
             )
             
@@ -187,11 +416,22 @@ class MessagePlatformCheck(Check):
                 status=CheckStatus.ERROR,
                 message=f"消息平台检查异常: {str(e)}",
                 metrics={},
-                timestamp=datetime.now(),
+                timestamp=now,
                 duration_ms=0
             )
     
-    def _check_whatsapp(self) -> Dict[str, Any]:
+    def _platform_result(self, future, platform_name: str, now_iso: str) -> Dict[str, Any]:
+        """获取平台探测结果，超时则返回错误状态"""
+        try:
+            return future.result(timeout=PLATFORM_CHECK_TIMEOUT)
+        except FuturesTimeoutError:
+            return {
+                "status": "error",
+                "message": f"{platform_name}检查超时（{PLATFORM_CHECK_TIMEOUT}秒）",
+                "tested_at": now_iso
+            }
+    
+    def _check_whatsapp(self, now_iso: str) -> Dict[str, Any]:
         """检查WhatsApp连接"""
         try:
             # 不发送测试消息，只是检查功能可用性
@@ -209,28 +449,28 @@ class MessagePlatformCheck(Check):
             return {
                 "status": "healthy",
                 "message": "WhatsApp连接正常（基于网关自动重连机制）",
-                "tested_at": datetime.now().isoformat(),
+                "tested_at": now_iso,
                 "note": "假设连接正常，网关有自动重连机制"
             }
         except Exception as e:
             return {
                 "status": "error",
                 "message": f"WhatsApp检查失败: {str(e)}",
-                "tested_at": datetime.now().isoformat()
+                "tested_at": now_iso
             }
     
-    def _check_wechat(self) -> Dict[str, Any]:
+    def _check_wechat(self, now_iso: str) -> Dict[str, Any]:
         """检查微信连接"""
         # 目前微信未配置，返回警告状态
         return {
             "status": "warning",
             "message": "微信推送未配置，不影响核心功能",
-            "tested_at": datetime.now().isoformat(),
+            "tested_at": now_iso,
             "suggestion": "如需微信推送，请配置相关参数"
         }
 
 
-class SystemResourcesCheck(Check):
+class SystemResourcesCheck(CachedCheck):
     """系统资源检查"""
     
     def __init__(self):
@@ -238,70 +478,68 @@ class SystemResourcesCheck(Check):
         super().__init__("system_resources", "系统资源检查", interval_seconds=300)
         self.add_tag("system")
         self.add_tag("resources")
+        self._project_path = os.path.dirname(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+        self._proc_reader = _LinuxProcReader() if _LinuxProcReader.available() else None
     
-    def execute(self) -> CheckResult:
+    def _do_execute(self) -> CheckResult:
         """执行系统资源检查"""
+        now = datetime.now()
+        if not PSUTIL_AVAILABLE:
+            # psutil未安装
+            return CheckResult(
+                check_id=self.check_id,
+                check_name=self.check_name,
+                status=CheckStatus.WARNING,
+                message="psutil未安装，无法检查系统资源",
+                metrics={
+                    "error": "psutil未安装",
+                    "suggestion": "运行: pip install psutil"
+                },
+                timestamp=now,
+                duration_ms=0
+            )
+        
         try:
-            import psutil
-            import platform
-            
-            start_time = time.time()
-            
-            metrics = {}
-            warnings = []
-            
-            # CPU使用率
-            cpu_percent = psutil.cpu_percent(interval=0.1)
-            metrics["cpu_percent"] = cpu_percent
+            start_ns = time.monotonic_ns()
             
-            # 内存使用率
-            memory = psutil.virtual_memory()
-            memory_percent = memory.percent
-            metrics["memory_percent"] = memory_percent
-            metrics["memory_total_gb"] = round(memory.total / (1024**3), 2)
-            metrics["memory_used_gb"] = round(memory.used / (1024**3), 2)
+            # CPU和内存使用率（Linux下直接读取/proc，其他系统使用psutil）
+            if self._proc_reader is not None:
+                cpu_percent = self._proc_reader.cpu_percent(interval=0.1)
+                memory = self._proc_reader.virtual_memory()
+                memory_total, memory_used, memory_percent = memory["total"], memory["used"], memory["percent"]
+            else:
+                per_core = _CpuSampler.get()
+                cpu_percent = round(sum(per_core) / len(per_core), 1) if per_core else 0.0
+                memory = psutil.virtual_memory()
+                memory_total, memory_used, memory_percent = memory.total, memory.used, memory.percent
             
             # 磁盘使用率
-            project_path = os.path.dirname(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
-            disk_usage = psutil.disk_usage(project_path)
-            disk_percent = disk_usage.percent
-            metrics["disk_percent"] = disk_percent
-            metrics["disk_free_gb"] = round(disk_usage.free / (1024**3), 2)
-            
-            # 确定状态
-            status = CheckStatus.HEALTHY
-            message = "系统资源正常"
-            
-            if cpu_percent > 90:
-                status = CheckStatus.ERROR
-                message = f"CPU使用率极高: {cpu_percent}%"
-                warnings.append(f"CPU使用率极高: {cpu_percent}%")
-            elif cpu_percent > 80:
-                status = CheckStatus.WARNING
-                message = f"CPU使用率偏高: {cpu_percent}%"
-                warnings.append(f"CPU使用率偏高: {cpu_percent}%")
-            
-            if memory_percent > 95:
-                status = CheckStatus.ERROR
-                message = f"内存使用率极高: {memory_percent}%"
-                warnings.append(f"内存使用率极高: {memory_percent}%")
-            elif memory_percent > 85:
-                status = CheckStatus.WARNING
-                message = f"内存使用率偏高: {memory_percent}%"
-                warnings.append(f"内存使用率偏高: {memory_percent}%")
+            _, disk_free, disk_percent = _disk_usage(self._project_path)
+            
+            metrics = {
+                "cpu_percent": cpu_percent,
+                "memory_percent": memory_percent,
+                "memory_total_gb": round(memory_total / (1024**3), 2),
+                "memory_used_gb": round(memory_used / (1024**3), 2),
+                "disk_percent": disk_percent,
+                "disk_free_gb": round(disk_free / (1024**3), 2)
+            }
             
-            if disk_percent > 95:
+            # 确定状态（严重问题优先，消息取最严重的一项；阈值表只读取其中的百分比指标）
+            criticals, warnings = _evaluate_thresholds(metrics)
+            if criticals:
                 status = CheckStatus.ERROR
-                message = f"磁盘空间严重不足: {disk_percent}%"
-                warnings.append(f"磁盘空间严重不足: {disk_percent}%")
-            elif disk_percent > 90:
+                message = criticals[0]
+            elif warnings:
                 status = CheckStatus.WARNING
-                message = f"磁盘空间紧张: {disk_percent}%"
-                warnings.append(f"磁盘空间紧张: {disk_percent}%")
+                message = warnings[0]
+            else:
+                status = CheckStatus.HEALTHY
+                message = "系统资源正常"
             
-            duration_ms = (time.time() - start_time) * 1000
+            duration_ms = (time.monotonic_ns() - start_ns) / 1_000_000
             
-            metrics["warnings"] = warnings
+            metrics["warnings"] = criticals + warnings
             
             return CheckResult(
                 check_id=self.check_id,
@@ -309,24 +547,10 @@ class SystemResourcesCheck(Check):
                 status=status,
                 message=message,
                 metrics=metrics,
-                timestamp=datetime.now(),
+                timestamp=now,
                 duration_ms=duration_ms
             )
             
-        except ImportError:
-            # psutil未安装
-            return CheckResult(
-                check_id=self.check_id,
-                check_name=self.check_name,
-                status=CheckStatus.WARNING,
-                message="psutil未安装，无法检查系统资源",
-                metrics={
-                    "error": "psutil未安装",
-                    "suggestion": "运行: pip install psutil"
-                },
-                timestamp=datetime.now(),
-                duration_ms=0
-            )
         except Exception as e:
             return CheckResult(
                 check_id=self.check_id,
@@ -334,57 +558,119 @@ class SystemResourcesCheck(Check):
                 status=CheckStatus.ERROR,
                 message=f"系统资源检查异常: {str(e)}",
                 metrics={"error": str(e)},
-                timestamp=datetime.now(),
+                timestamp=now,
                 duration_ms=0
             )
 
 
-class EnhancedSystemResourcesCheck(Check):
+class EnhancedSystemResourcesCheck(CachedCheck):
     """增强版系统资源检查（更多详细指标）"""
     
+    # 进程生命周期内不变的系统信息，首次使用时采集并缓存
+    _STATIC_SYSTEM: Optional[Dict[str, Any]] = None
+    _BOOT_TIME: float = 0.0
+    _CPU_COUNT: int = 0
+    
     def __init__(self):
         """初始化增强版系统资源检查"""
         super().__init__("system_resources_enhanced", "增强版系统资源检查", interval_seconds=600)
         self.add_tag("system")
         self.add_tag("resources")
         self.add_tag("detailed")
+        self._project_path = os.path.dirname(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+        
+        # 网络连接数统计开销大（需遍历所有socket），每N次检查采样一次并缓存
+        self._conn_sample_every = 6
+        self._conn_sample_counter = 0
+        self._connections_count: Optional[int] = None
+        
+        # 预先绑定execute中用到的psutil函数，减少每次检查的属性查找
+        self._ps = (
+            psutil.cpu_freq,
+            psutil.virtual_memory,
+            psutil.swap_memory,
+            psutil.disk_partitions,
+            psutil.net_io_counters,
+            psutil.disk_io_counters,
+        ) if PSUTIL_AVAILABLE else None
+        
+        # 上一次的网络/磁盘IO计数器，用于计算两次检查之间的速率（而非开机以来的累计值）
+        self._last_net = psutil.net_io_counters() if PSUTIL_AVAILABLE else None
+        self._last_disk_io = psutil.disk_io_counters() if PSUTIL_AVAILABLE else None
+        self._last_io_ts = time.monotonic()
     
-    def execute(self) -> CheckResult:
+    @classmethod
+    def _get_static(cls) -> Dict[str, Any]:
+        """获取静态系统信息（平台、Python版本、启动时间等，只采集一次）"""
+        if cls._STATIC_SYSTEM is None:
+            cls._BOOT_TIME = psutil.boot_time()
+            cls._CPU_COUNT = psutil.cpu_count() or 0
+            cls._STATIC_SYSTEM = {
+                "platform": platform.platform(),
+                "system": platform.system(),
+                "release": platform.release(),
+                "python_version": platform.python_version(),
+                "boot_time": datetime.fromtimestamp(cls._BOOT_TIME).isoformat()
+            }
+        return cls._STATIC_SYSTEM
+    
+    def _get_connections_count(self) -> Optional[int]:
+        """获取网络连接数（只统计inet连接，每_conn_sample_every次检查重新采样一次）"""
+        if self._connections_count is None or self._conn_sample_counter % self._conn_sample_every == 0:
+            try:
+                self._connections_count = len(psutil.net_connections(kind="inet"))
+            except (psutil.AccessDenied, OSError):
+                self._connections_count = None
+        self._conn_sample_counter += 1
+        return self._connections_count
+    
+    def _do_execute(self) -> CheckResult:
         """执行增强版系统资源检查"""
+        now = datetime.now()
+        if not PSUTIL_AVAILABLE:
+            return CheckResult(
+                check_id=self.check_id,
+                check_name=self.check_name,
+                status=CheckStatus.WARNING,
+                message="依赖库未安装: psutil",
+                metrics={
+                    "error": "依赖库未安装: psutil",
+                    "suggestion": "运行: pip install psutil"
+                },
+                timestamp=now,
+                duration_ms=0
+            )
+        
         try:
-            import psutil
-            import platform
-            import os
-            
-            start_time = time.time()
+            start_ns = time.monotonic_ns()
+            (cpu_freq_fn, virtual_memory_fn, swap_memory_fn,
+             disk_partitions_fn, net_io_counters_fn, disk_io_counters_fn) = self._ps
             
-            metrics = {}
             warnings = []
             criticals = []
             
-            # 1. CPU监控
-            cpu_percent = psutil.cpu_percent(interval=0.1)
-            cpu_count = psutil.cpu_count()
-            cpu_freq = psutil.cpu_freq()
+            # 1. CPU监控（读取后台采样器的最新每核使用率，整体使用率取平均值）
+            static_system = self._get_static()
+            per_core = _CpuSampler.get()
+            cpu_percent = round(sum(per_core) / len(per_core), 1) if per_core else 0.0
+            cpu_window = _CpuSampler.window_stats()
+            cpu_count = self._CPU_COUNT
+            cpu_freq = cpu_freq_fn()
             
-            metrics["cpu"] = {
+            cpu_metrics = {
                 "percent": cpu_percent,
                 "count": cpu_count,
                 "frequency_mhz": cpu_freq.current if cpu_freq else None,
-                "load_per_core": psutil.cpu_percent(interval=0.1, percpu=True)
+                "load_per_core": per_core,
+                "percent_avg_1min": cpu_window["avg"],
+                "percent_max_1min": cpu_window["max"]
             }
             
-            # CPU状态判断
-            if cpu_percent > 90:
-                criticals.append(f"CPU使用率极高: {cpu_percent}%")
-            elif cpu_percent > 80:
-                warnings.append(f"CPU使用率偏高: {cpu_percent}%")
-            
             # 2. 内存监控
-            memory = psutil.virtual_memory()
-            swap = psutil.swap_memory()
+            memory = virtual_memory_fn()
+            swap = swap_memory_fn()
             
-            metrics["memory"] = {
+            memory_metrics = {
                 "percent": memory.percent,
                 "total_gb": round(memory.total / (1024**3), 2),
                 "used_gb": round(memory.used / (1024**3), 2),
@@ -394,72 +680,99 @@ class EnhancedSystemResourcesCheck(Check):
                 "swap_used_gb": round(swap.used / (1024**3), 2)
             }
             
-            if memory.percent > 95:
-                criticals.append(f"内存使用率极高: {memory.percent}%")
-            elif memory.percent > 85:
-                warnings.append(f"内存使用率偏高: {memory.percent}%")
+            # CPU和内存状态判断
+            resource_criticals, resource_warnings = _evaluate_thresholds({
+                "cpu_percent": cpu_percent,
+                "memory_percent": memory.percent
+            })
+            criticals.extend(resource_criticals)
+            warnings.extend(resource_warnings)
             
             if swap.percent > 80:
                 warnings.append(f"Swap使用率偏高: {swap.percent}%")
             
             # 3. 磁盘监控
-            project_path = os.path.dirname(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
-            disk_usage = psutil.disk_usage(project_path)
+            project_path = self._project_path
+            project_total, project_free, project_percent = _disk_usage(project_path)
             
-            # 检查多个重要分区
+            # 检查多个重要分区（仅本地文件系统，并发获取使用率并设置超时）
+            local_partitions = [p for p in disk_partitions_fn(all=False) if p.fstype in LOCAL_FSTYPES]
             partitions = []
-            for partition in psutil.disk_partitions():
+            usage_futures = [(p, _DISK_PROBES.submit(p.mountpoint, _disk_usage, p.mountpoint))
+                             for p in local_partitions]
+            for partition, usage_future in usage_futures:
                 try:
-                    usage = psutil.disk_usage(partition.mountpoint)
+                    total, free, percent = usage_future.result(timeout=DISK_USAGE_TIMEOUT)
                     partitions.append({
                         "device": partition.device,
                         "mountpoint": partition.mountpoint,
-                        "percent": usage.percent,
-                        "total_gb": round(usage.total / (1024**3), 2),
-                        "free_gb": round(usage.free / (1024**3), 2)
+                        "percent": percent,
+                        "total_gb": round(total / (1024**3), 2),
+                        "free_gb": round(free / (1024**3), 2)
                     })
                     
                     # 检查关键分区
                     if partition.mountpoint in ["/", "/home", project_path]:
-                        if usage.percent > 95:
-                            criticals.append(f"磁盘空间严重不足 ({partition.mountpoint}): {usage.percent}%")
-                        elif usage.percent > 90:
-                            warnings.append(f"磁盘空间紧张 ({partition.mountpoint}): {usage.percent}%")
-                except:
+                        if percent > 95:
+                            criticals.append(f"磁盘空间严重不足 ({partition.mountpoint}): {percent}%")
+                        elif percent > 90:
+                            warnings.append(f"磁盘空间紧张 ({partition.mountpoint}): {percent}%")
+                except (OSError, FuturesTimeoutError):
                     continue
             
-            metrics["disk"] = {
-                "project_path_percent": disk_usage.percent,
-                "project_total_gb": round(disk_usage.total / (1024**3), 2),
-                "project_free_gb": round(disk_usage.free / (1024**3), 2),
-                "partitions": partitions
+            # 磁盘IO和网络速率（与上一次检查的计数器求差）
+            io_ts = time.monotonic()
+            io_elapsed = max(io_ts - self._last_io_ts, 1e-6)
+            disk_io = disk_io_counters_fn()
+            last_disk_io = self._last_disk_io
+            
+            disk_metrics = {
+                "project_path_percent": project_percent,
+                "project_total_gb": round(project_total / (1024**3), 2),
+                "project_free_gb": round(project_free / (1024**3), 2),
+                "partitions": partitions,
+                "read_mb_per_sec": round((disk_io.read_bytes - last_disk_io.read_bytes) / io_elapsed / (1024**2), 3)
+                    if disk_io and last_disk_io else None,
+                "write_mb_per_sec": round((disk_io.write_bytes - last_disk_io.write_bytes) / io_elapsed / (1024**2), 3)
+                    if disk_io and last_disk_io else None
             }
             
             # 4. 网络监控
-            net_io = psutil.net_io_counters()
-            metrics["network"] = {
-                "bytes_sent_mb": round(net_io.bytes_sent / (1024**2), 2),
-                "bytes_recv_mb": round(net_io.bytes_recv / (1024**2), 2),
-                "packets_sent": net_io.packets_sent,
-                "packets_recv": net_io.packets_recv,
-                "connections_count": len(psutil.net_connections())
+            net_io = net_io_counters_fn()
+            last_net = self._last_net
+            network_metrics = {
+                "send_mbps": round((net_io.bytes_sent - last_net.bytes_sent) * 8 / (io_elapsed * 1e6), 3),
+                "recv_mbps": round((net_io.bytes_recv - last_net.bytes_recv) * 8 / (io_elapsed * 1e6), 3),
+                "packets_sent_per_sec": round((net_io.packets_sent - last_net.packets_sent) / io_elapsed, 1),
+                "packets_recv_per_sec": round((net_io.packets_recv - last_net.packets_recv) / io_elapsed, 1),
+                "sample_seconds": round(io_elapsed, 1),
+                "connections_count": self._get_connections_count()
             }
-            
-            # 5. 系统信息
-            metrics["system"] = {
-                "platform": platform.platform(),
-                "system": platform.system(),
-                "release": platform.release(),
-                "python_version": platform.python_version(),
-                "boot_time": datetime.fromtimestamp(psutil.boot_time()).isoformat(),
-                "uptime_hours": round((time.time() - psutil.boot_time()) / 3600, 2)
+            self._last_net, self._last_disk_io, self._last_io_ts = net_io, disk_io, io_ts
+            
+            # 5. 当前进程信息（oneshot缓存/proc/<pid>读取，一次解析多项指标）
+            process = psutil.Process()
+            with process.oneshot():
+                process_memory = process.memory_info()
+                process_metrics = {
+                    "pid": process.pid,
+                    "memory_rss_mb": round(process_memory.rss / (1024**2), 2),
+                    "num_threads": process.num_threads(),
+                    "cpu_times_user": process.cpu_times().user
+                }
+            
+            # 6. 系统信息
+            system_metrics = {
+                **static_system,
+                "uptime_hours": round((time.time() - self._BOOT_TIME) / 3600, 2)
             }
             
-            # 6. 负载平均值（仅Linux）
+            # 7. 负载平均值（仅Linux）
+            load_metrics = None
             if hasattr(os, 'getloadavg'):
                 try:
                     load1, load5, load15 = os.getloadavg()
-                    metrics["load"] = {
+                    load_metrics = {
                         "1min": load1,
                         "5min": load5,
                         "15min": load15,
@@ -470,7 +783,7 @@ class EnhancedSystemResourcesCheck(Check):
                         criticals.append(f"系统负载极高: {load1} (CPU数: {cpu_count})")
                     elif load1 > cpu_count:
                         warnings.append(f"系统负载偏高: {load1} (CPU数: {cpu_count})")
-                except:
+                except OSError:
                     pass
             
             # 确定整体状态
@@ -484,30 +797,31 @@ class EnhancedSystemResourcesCheck(Check):
                 status = CheckStatus.HEALTHY
                 message = "系统资源正常"
             
-            duration_ms = (time.time() - start_time) * 1000
-            
-            metrics["warnings"] = warnings
-            metrics["criticals"] = criticals
+            duration_ms = (time.monotonic_ns() - start_ns) / 1_000_000
             
             # 生成系统摘要
-            summary_parts = []
-            if "cpu" in metrics:
-                cpu = metrics["cpu"]
-                summary_parts.append(f"CPU: {cpu['percent']}% ({cpu['count']}核)")
-            
-            if "memory" in metrics:
-                memory = metrics["memory"]
-                summary_parts.append(f"内存: {memory['percent']}% ({memory['used_gb']}/{memory['total_gb']}GB)")
-            
-            if "disk" in metrics:
-                disk = metrics["disk"]
-                summary_parts.append(f"磁盘: {disk['project_path_percent']}%")
-            
-            if "load" in metrics:
-                load = metrics["load"]
-                summary_parts.append(f"负载: {load['1min']:.2f},{load['5min']:.2f},{load['15min']:.2f}")
-            
-            metrics["summary"] = " | ".join(summary_parts)
+            summary_parts = [
+                f"CPU: {cpu_percent}% ({cpu_count}核)",
+                f"内存: {memory_metrics['percent']}% ({memory_metrics['used_gb']}/{memory_metrics['total_gb']}GB)",
+                f"磁盘: {disk_metrics['project_path_percent']}%"
+            ]
+            if load_metrics is not None:
+                summary_parts.append(f"负载: {load1:.2f},{load5:.2f},{load15:.2f}")
+            
+            # 一次性构建指标字典
+            metrics = {
+                "cpu": cpu_metrics,
+                "memory": memory_metrics,
+                "disk": disk_metrics,
+                "network": network_metrics,
+                "process": process_metrics,
+                "system": system_metrics,
+                "warnings": warnings,
+                "criticals": criticals,
+                "summary": " | ".join(summary_parts)
+            }
+            if load_metrics is not None:
+                metrics["load"] = load_metrics
             
             return CheckResult(
                 check_id=self.check_id,
@@ -515,23 +829,10 @@ class EnhancedSystemResourcesCheck(Check):
                 status=status,
                 message=message,
                 metrics=metrics,
-                timestamp=datetime.now(),
+                timestamp=now,
                 duration_ms=duration_ms
             )
             
-        except ImportError as e:
-            return CheckResult(
-                check_id=self.check_id,
-                check_name=self.check_name,
-                status=CheckStatus.WARNING,
-                message=f"依赖库未安装: {str(e)}",
-                metrics={
-                    "error": f"依赖库未安装: {str(e)}",
-                    "suggestion": "运行: pip install psutil"
-                },
-                timestamp=datetime.now(),
-                duration_ms=0
-            )
         except Exception as e:
             return CheckResult(
                 check_id=self.check_id,
@@ -539,7 +840,7 @@ class EnhancedSystemResourcesCheck(Check):
                 status=CheckStatus.ERROR,
                 message=f"增强版系统资源检查异常: {str(e)}",
                 metrics={"error": str(e)},
-                timestamp=datetime.now(),
+                timestamp=now,
                 duration_ms=0
             )
 
@@ -566,19 +867,23 @@ def test_system_checks():
     
     checks = create_default_checks()
     
-    for check in checks:
-        print(f"\n🔍 测试检查: {check.check_name}")
-        try:
-            result = check.execute()
-            print(f"  状态: {result.status.value}")
-            print(f"  消息: {result.message}")
-            print(f"  耗时: {result.duration_ms:.1f}ms")
-            
-            if result.metrics.get('summary'):
-                print(f"  摘要: {result.metrics['summary']}")
+    # 并发执行所有检查，按完成顺序输出
+    with ThreadPoolExecutor(max_workers=len(checks)) as executor:
+        futures = {executor.submit(check.execute): check for check in checks}
+        for future in as_completed(futures):
+            check = futures[future]
+            print(f"\n🔍 测试检查: {check.check_name}")
+            try:
+                result = future.result()
+                print(f"  状态: {result.status.value}")
+                print(f"  消息: {result.message}")
+                print(f"  耗时: {result.duration_ms:.1f}ms")
                 
-        except Exception as e:
-            print(f"  ❌ 检查失败: {e}")
+                if result.metrics.get('summary'):
+                    print(f"  摘要: {result.metrics['summary']}")
+                    
+            except Exception as e:
+                print(f"  ❌ 检查失败: {e}")
     
     print("\n✅ 系统检查测试完成")
 
@@ -3,13 +3,15 @@ Situation-Monitor 核心引擎
 包含主监控器、调度器和情境感知引擎
 """
 
-from .monitor import SituationMonitor, Check, CheckResult, Alert, CheckStatus, AlertLevel
+from .monitor import SituationMonitor, Check, AsyncCheck, CheckResult, Alert, CheckStatus, AlertLevel, ProbeRunner
 
 __all__ = [
     'SituationMonitor',
     'Check',
+    'AsyncCheck',
     'CheckResult',
     'Alert',
     'CheckStatus',
     'AlertLevel',
+    'ProbeRunner',
 ]
\ No newline at end of file
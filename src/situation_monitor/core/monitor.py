@@ -3,20 +3,61 @@
 情境监控器 - 核心监控引擎
 """
 
+import os
+import sys
 import time
+import heapq
+import queue
 import threading
 import asyncio
+from collections import deque
+from concurrent.futures import Future, ThreadPoolExecutor
 from datetime import datetime, timedelta
-from typing import Dict, List, Any, Optional, Callable, Union
-from dataclasses import dataclass
+from typing import Dict, List, Any, Optional, Callable, Union, FrozenSet
+from dataclasses import dataclass, field
 from enum import Enum
 import json
 import logging
 
+# orjson为可选依赖，可用时加速JSON序列化
+try:
+    import orjson
+    ORJSON_AVAILABLE = True
+except ImportError:
+    ORJSON_AVAILABLE = False
+
+# psutil为可选依赖，仅示例检查SystemHealthCheck使用
+try:
+    import psutil
+    PSUTIL_AVAILABLE = True
+except ImportError:
+    PSUTIL_AVAILABLE = False
+
 # 配置日志
 logging.basicConfig(level=logging.INFO, format='%(asctime)s - %(name)s - %(levelname)s - %(message)s')
 logger = logging.getLogger(__name__)
 
+# 异步检查运行在独立事件循环中，屏蔽asyncio的调试级日志
+logging.getLogger("asyncio").setLevel(logging.WARNING)
+
+# 拥有独立线程池的检查标签（这些检查不会被其他耗时检查占满线程而饿死）
+DEDICATED_POOL_TAGS = ("essential",)
+
+# 每个检查线程池的工作线程数（检查多为I/O等待，按CPU核数放大）
+CHECK_POOL_WORKERS = min(32, (os.cpu_count() or 4) * 4)
+
+# Python 3.10+ 的数据类使用__slots__，旧版本退化为普通数据类
+_DATACLASS_OPTIONS = {"slots": True} if sys.version_info >= (3, 10) else {}
+
+# 没有待调度检查时，监控循环的最长等待时间（秒）
+IDLE_WAIT_SECONDS = 60
+
+# 监控器在内存中保留的最近检查结果和告警数量
+HISTORY_SIZE = 1000
+
+# 相同来源、标题和级别的告警最短重复间隔（秒），用于抑制抖动检查造成的告警风暴
+ALERT_MIN_INTERVAL_SECONDS = 60
+
 
 class CheckStatus(Enum):
     """检查状态枚举"""
@@ -35,7 +76,23 @@ class AlertLevel(Enum):
     CRITICAL = "critical"   # 严重
 
 
-@dataclass
+# 检查结果未填写耗时的标记值
+_UNSET_DURATION = -1.0
+
+# 标签集合池：相同的标签组合在所有检查间共享同一个frozenset
+_TAG_POOL: Dict[FrozenSet[str], FrozenSet[str]] = {}
+
+# 检查状态到告警级别的映射（模块加载时构建一次，覆盖CheckStatus的全部成员，可直接下标访问）
+_STATUS_TO_LEVEL = {
+    CheckStatus.HEALTHY: AlertLevel.INFO,
+    CheckStatus.WARNING: AlertLevel.WARNING,
+    CheckStatus.ERROR: AlertLevel.ERROR,
+    CheckStatus.CRITICAL: AlertLevel.CRITICAL,
+    CheckStatus.UNKNOWN: AlertLevel.WARNING
+}
+
+
+@dataclass(**_DATACLASS_OPTIONS)
 class CheckResult:
     """检查结果数据类"""
     check_id: str
@@ -44,8 +101,8 @@ class CheckResult:
     message: str
     metrics: Dict[str, Any]
     timestamp: datetime
-    duration_ms: float
-    tags: List[str] = None
+    duration_ms: float = _UNSET_DURATION  # 检查可不填写，由监控器计算
+    tags: Optional[FrozenSet[str]] = None
     
     def to_dict(self) -> Dict[str, Any]:
         """转换为字典"""
@@ -57,11 +114,20 @@ class CheckResult:
             "metrics": self.metrics,
             "timestamp": self.timestamp.isoformat(),
             "duration_ms": self.duration_ms,
-            "tags": self.tags or []
+            "tags": sorted(self.tags) if self.tags else []
         }
+    
+    def to_json(self) -> bytes:
+        """
+        序列化为JSON字节串
+        orjson可用时直接序列化数据类，不构建中间字典
+        """
+        if ORJSON_AVAILABLE:
+            return orjson.dumps(self, default=_json_default)
+        return _dumps(self.to_dict())
 
 
-@dataclass
+@dataclass(**_DATACLASS_OPTIONS)
 class Alert:
     """告警数据类"""
     alert_id: str
@@ -73,6 +139,19 @@ class Alert:
     context: Dict[str, Any] = None
     resolved: bool = False
     resolved_at: Optional[datetime] = None
+    result: Optional[CheckResult] = field(default=None, repr=False, compare=False)  # 触发告警的检查结果
+    
+    def get_context(self) -> Dict[str, Any]:
+        """
+        获取告警上下文
+        由检查结果触发的告警在首次访问时才序列化检查结果，并缓存到context
+        
+        Returns:
+            上下文字典
+        """
+        if self.context is None and self.result is not None:
+            self.context = {"check_result": self.result.to_dict()}
+        return self.context or {}
     
     def to_dict(self) -> Dict[str, Any]:
         """转换为字典"""
@@ -83,15 +162,104 @@ class Alert:
             "message": self.message,
             "source": self.source,
             "timestamp": self.timestamp.isoformat(),
-            "context": self.context or {},
+            "context": self.get_context(),
             "resolved": self.resolved,
             "resolved_at": self.resolved_at.isoformat() if self.resolved_at else None
         }
+    
+    def to_json(self) -> bytes:
+        """序列化为JSON字节串"""
+        return _dumps(self.to_dict())
+
+
+def _json_default(obj: Any) -> Any:
+    """JSON序列化时处理非内置类型"""
+    if isinstance(obj, Enum):
+        return obj.value
+    if isinstance(obj, (set, frozenset)):
+        return sorted(obj)
+    if isinstance(obj, datetime):
+        return obj.isoformat()
+    return str(obj)
+
+
+def _dumps(data: Any) -> bytes:
+    """序列化为UTF-8编码的JSON字节串（优先使用orjson）"""
+    if ORJSON_AVAILABLE:
+        return orjson.dumps(data, default=_json_default)
+    return json.dumps(data, ensure_ascii=False, default=_json_default).encode("utf-8")
+
+
+def _is_healthy(result: Optional[CheckResult]) -> bool:
+    """判断检查结果是否健康（无结果视为不健康）"""
+    return result is not None and result.status == CheckStatus.HEALTHY
+
+
+class ProbeRunner:
+    """
+    在守护线程中执行可能挂起的探测（失效的挂载点、无响应的外部命令等）
+    
+    调用方通过Future.result(timeout)施加超时；超时的探测留在后台线程中，
+    守护线程不会阻止进程退出。同一个键同时最多只有一个探测在运行：
+    上一次探测尚未结束时直接返回它的Future，挂起的探测不会不断堆积线程。
+    """
+    
+    def __init__(self, name: str):
+        """
+        Args:
+            name: 线程名前缀
+        """
+        self.name = name
+        self._inflight: Dict[str, Future] = {}
+        self._lock = threading.Lock()
+    
+    def submit(self, key: str, fn: Callable[..., Any], *args) -> Future:
+        """
+        提交探测
+        
+        Args:
+            key: 探测键（如组件名、挂载点）
+            fn: 探测函数
+            *args: 探测函数参数
+            
+        Returns:
+            探测结果的Future（可能是同一键上仍在运行的上一次探测）
+        """
+        with self._lock:
+            future = self._inflight.get(key)
+            if future is not None and not future.done():
+                return future
+            future = self._inflight[key] = Future()
+        
+        threading.Thread(target=self._run, args=(future, fn, args),
+                         name=f"{self.name}-{key}", daemon=True).start()
+        return future
+    
+    def busy(self, key: str) -> bool:
+        """该键上是否有尚未结束的探测"""
+        future = self._inflight.get(key)
+        return future is not None and not future.done()
+    
+    @staticmethod
+    def _run(future: Future, fn: Callable[..., Any], args: tuple):
+        """在守护线程中执行探测并设置Future结果"""
+        future.set_running_or_notify_cancel()
+        try:
+            future.set_result(fn(*args))
+        except BaseException as e:
+            future.set_exception(e)
 
 
 class Check:
     """监控检查基类"""
     
+    # 子类未声明__slots__时仍会获得__dict__，可以自由添加属性
+    __slots__ = ("check_id", "check_name", "interval_seconds", "last_run",
+                 "last_run_ns", "last_run_iso", "last_result", "enabled", "tags")
+    
+    # 为False时run_all_checks在其他检查完成后才单独运行它（用于不能与其他检查同时运行的检查）
+    safe_for_parallel = True
+    
     def __init__(self, check_id: str, check_name: str, interval_seconds: int = 60):
         """
         初始化检查
@@ -105,28 +273,99 @@ class Check:
         self.check_name = check_name
         self.interval_seconds = interval_seconds
         self.last_run: Optional[datetime] = None
+        self.last_run_ns: Optional[int] = None  # time.monotonic_ns()，用于计算间隔
+        self.last_run_iso: Optional[str] = None  # last_run的ISO格式字符串，供状态查询复用
         self.last_result: Optional[CheckResult] = None
         self.enabled: bool = True
-        self.tags: List[str] = []
+        self.tags: FrozenSet[str] = frozenset()
         
     def execute(self) -> CheckResult:
         """
         执行检查（子类必须实现）
+        返回的结果可以不填写duration_ms，由监控器在运行检查时计算
         
         Returns:
             检查结果
         """
         raise NotImplementedError("子类必须实现 execute 方法")
     
+    def close(self):
+        """释放检查持有的资源（如长连接），子类按需覆盖"""
+        pass
+    
     def add_tag(self, tag: str):
         """添加标签"""
         if tag not in self.tags:
-            self.tags.append(tag)
+            tags = self.tags | {sys.intern(tag)}
+            self.tags = _TAG_POOL.setdefault(tags, tags)
     
     def __str__(self) -> str:
         return f"Check({self.check_id}: {self.check_name})"
 
 
+class AsyncCheck(Check):
+    """异步监控检查基类（适合大量网络/HTTP探测，在监控器的事件循环中运行）"""
+    
+    async def execute_async(self) -> CheckResult:
+        """
+        异步执行检查（子类必须实现）
+        
+        Returns:
+            检查结果
+        """
+        raise NotImplementedError("子类必须实现 execute_async 方法")
+    
+    def execute(self) -> CheckResult:
+        """同步执行检查（脱离监控器单独调用时使用）"""
+        return asyncio.run(self.execute_async())
+
+
+class _MetricBatcher:
+    """指标批量分发器：攒够max_size条结果或等待max_wait_ms后一次性调用回调"""
+    
+    def __init__(self, callback: Callable[[List[CheckResult]], None], max_size: int, max_wait_ms: int):
+        self.callback = callback
+        self.max_size = max_size
+        self.max_wait = max_wait_ms / 1000
+        self._buffer: List[CheckResult] = []
+        self._lock = threading.Lock()
+        self._timer: Optional[threading.Timer] = None
+    
+    def add(self, result: CheckResult):
+        """加入一条结果，缓冲区满时立即分发，否则确保有定时刷新"""
+        with self._lock:
+            self._buffer.append(result)
+            if len(self._buffer) < self.max_size:
+                if self._timer is None:
+                    self._timer = threading.Timer(self.max_wait, self.flush)
+                    self._timer.daemon = True
+                    self._timer.start()
+                return
+            batch = self._take_locked()
+        self._deliver(batch)
+    
+    def flush(self):
+        """立即分发缓冲区中的全部结果"""
+        with self._lock:
+            batch = self._take_locked()
+        if batch:
+            self._deliver(batch)
+    
+    def _take_locked(self) -> List[CheckResult]:
+        """取出缓冲区内容并取消定时刷新（调用方需持有锁）"""
+        if self._timer is not None:
+            self._timer.cancel()
+            self._timer = None
+        batch, self._buffer = self._buffer, []
+        return batch
+    
+    def _deliver(self, batch: List[CheckResult]):
+        try:
+            self.callback(batch)
+        except Exception as e:
+            logger.error("批量指标回调执行失败: %s", e)
+
+
 class SituationMonitor:
     """情境监控器"""
     
@@ -139,10 +378,43 @@ class SituationMonitor:
         """
         self.monitor_id = monitor_id
         self.checks: Dict[str, Check] = {}
+        # 已启用检查的快照（按注册顺序）及其中健康检查的数量，仅在检查增删或启停时重建
+        self._enabled: tuple = ()
+        self._healthy_count = 0
+        self._checks_lock = threading.Lock()
         self.running: bool = False
         self.monitor_thread: Optional[threading.Thread] = None
         self.alert_callbacks: List[Callable[[Alert], None]] = []
         self.metric_callbacks: List[Callable[[CheckResult], None]] = []
+        self._metric_batchers: List[_MetricBatcher] = []
+        
+        # 按标签划分的检查线程池（首次使用时创建）
+        self._executors: Dict[str, ThreadPoolExecutor] = {}
+        self._executors_lock = threading.Lock()
+        self._stats_lock = threading.Lock()
+        
+        # 运行异步检查的事件循环（首次使用时创建）
+        self._loop: Optional[asyncio.AbstractEventLoop] = None
+        self._loop_thread: Optional[threading.Thread] = None
+        
+        # 最近的检查结果和告警（环形缓冲区，内存占用固定）
+        self.result_history: deque = deque(maxlen=HISTORY_SIZE)
+        self.alert_history: deque = deque(maxlen=HISTORY_SIZE)
+        
+        # 告警去重窗口：(来源, 标题, 级别) -> 上次发出的monotonic时间
+        self.alert_min_interval = ALERT_MIN_INTERVAL_SECONDS
+        self._alert_window: Dict[tuple, float] = {}
+        self._alert_window_lock = threading.Lock()
+        
+        # 运行期间告警回调在独立线程中分发，检查线程无需等待回调完成
+        self._alert_queue: "queue.Queue[Optional[Alert]]" = queue.Queue()
+        self._alert_thread: Optional[threading.Thread] = None
+        
+        # 调度堆：(下次运行的monotonic时间, 检查ID)，过期条目在出堆时丢弃
+        self._heap: List[tuple] = []
+        self._next_run: Dict[str, float] = {}
+        self._heap_lock = threading.Lock()
+        self._wake = threading.Event()
         
         # 统计信息
         self.stats = {
@@ -152,8 +424,9 @@ class SituationMonitor:
             "last_check_time": None,
             "start_time": datetime.now()
         }
+        self._start_ns = time.monotonic_ns()
         
-        logger.info(f"情境监控器初始化: {monitor_id}")
+        logger.info("情境监控器初始化: %s", monitor_id)
     
     def add_check(self, check: Check):
         """
@@ -162,12 +435,16 @@ class SituationMonitor:
         Args:
             check: 检查实例
         """
-        if check.check_id in self.checks:
-            logger.warning(f"检查ID已存在: {check.check_id}, 将被覆盖")
+        with self._checks_lock:
+            if check.check_id in self.checks:
+                logger.warning("检查ID已存在: %s, 将被覆盖", check.check_id)
+            
+            self.checks[check.check_id] = check
+            self.stats["total_checks"] = len(self.checks)
+            self._refresh_enabled()
         
-        self.checks[check.check_id] = check
-        self.stats["total_checks"] = len(self.checks)
-        logger.info(f"添加检查: {check}")
+        self._schedule(check.check_id, time.monotonic())
+        logger.info("添加检查: %s", check)
     
     def remove_check(self, check_id: str):
         """
@@ -176,21 +453,42 @@ class SituationMonitor:
         Args:
             check_id: 检查ID
         """
-        if check_id in self.checks:
+        with self._checks_lock:
+            if check_id not in self.checks:
+                return
             del self.checks[check_id]
-            logger.info(f"移除检查: {check_id}")
+            self._refresh_enabled()
+        
+        with self._heap_lock:
+            self._next_run.pop(check_id, None)
+        self._wake.set()
+        logger.info("移除检查: %s", check_id)
     
     def enable_check(self, check_id: str):
         """启用检查"""
-        if check_id in self.checks:
+        with self._checks_lock:
+            if check_id not in self.checks:
+                return
             self.checks[check_id].enabled = True
-            logger.info(f"启用检查: {check_id}")
+            self._refresh_enabled()
+        
+        self._schedule(check_id, time.monotonic())
+        logger.info("启用检查: %s", check_id)
     
     def disable_check(self, check_id: str):
         """禁用检查"""
-        if check_id in self.checks:
+        with self._checks_lock:
+            if check_id not in self.checks:
+                return
             self.checks[check_id].enabled = False
-            logger.info(f"禁用检查: {check_id}")
+            self._refresh_enabled()
+        
+        logger.info("禁用检查: %s", check_id)
+    
+    def _refresh_enabled(self):
+        """重建已启用检查的快照和健康计数（调用方需持有_checks_lock）"""
+        self._enabled = tuple(check for check in self.checks.values() if check.enabled)
+        self._healthy_count = sum(1 for check in self._enabled if _is_healthy(check.last_result))
     
     def register_alert_callback(self, callback: Callable[[Alert], None]):
         """
@@ -200,7 +498,7 @@ class SituationMonitor:
             callback: 告警回调函数
         """
         self.alert_callbacks.append(callback)
-        logger.info(f"注册告警回调: {callback.__name__ if hasattr(callback, '__name__') else 'anonymous'}")
+        logger.info("注册告警回调: %s", getattr(callback, '__name__', 'anonymous'))
     
     def register_metric_callback(self, callback: Callable[[CheckResult], None]):
         """
@@ -210,7 +508,38 @@ class SituationMonitor:
             callback: 指标回调函数
         """
         self.metric_callbacks.append(callback)
-        logger.info(f"注册指标回调: {callback.__name__ if hasattr(callback, '__name__') else 'anonymous'}")
+        logger.info("注册指标回调: %s", getattr(callback, '__name__', 'anonymous'))
+    
+    def register_metric_batch_callback(self, callback: Callable[[List[CheckResult]], None],
+                                       max_size: int = 32, max_wait_ms: int = 200):
+        """
+        注册批量指标回调（适合需要远程上报的回调，多条结果合并为一次调用）
+        
+        Args:
+            callback: 接收检查结果列表的回调函数
+            max_size: 每批最多结果数，达到后立即分发
+            max_wait_ms: 结果在缓冲区中的最长等待时间（毫秒）
+        """
+        self._metric_batchers.append(_MetricBatcher(callback, max_size, max_wait_ms))
+        logger.info("注册批量指标回调: %s", getattr(callback, '__name__', 'anonymous'))
+    
+    def flush_metrics(self):
+        """立即分发所有批量指标回调中缓冲的结果"""
+        for batcher in self._metric_batchers:
+            batcher.flush()
+    
+    def _get_runnable_check(self, check_id: str) -> Optional[Check]:
+        """获取可运行的检查，不存在或已禁用时返回None"""
+        check = self.checks.get(check_id)
+        if check is None:
+            logger.error("检查不存在: %s", check_id)
+            return None
+        
+        if not check.enabled:
+            logger.info("检查已禁用: %s", check_id)
+            return None
+        
+        return check
     
     def run_check(self, check_id: str) -> Optional[CheckResult]:
         """
@@ -222,116 +551,332 @@ class SituationMonitor:
         Returns:
             检查结果，如果检查不存在则返回None
         """
-        if check_id not in self.checks:
-            logger.error(f"检查不存在: {check_id}")
+        check = self._get_runnable_check(check_id)
+        if check is None:
             return None
         
-        check = self.checks[check_id]
-        if not check.enabled:
-            logger.info(f"检查已禁用: {check_id}")
-            return None
+        # 异步检查交给监控器的事件循环执行
+        if isinstance(check, AsyncCheck):
+            return asyncio.run_coroutine_threadsafe(self.run_check_async(check_id), self._get_loop()).result()
         
         try:
-            start_time = time.time()
+            start_ns = time.monotonic_ns()
             result = check.execute()
-            duration_ms = (time.time() - start_time) * 1000
+            return self._handle_result(check, result, start_ns)
             
-            # 更新结果信息
-            result.duration_ms = duration_ms
-            result.timestamp = datetime.now()
-            result.tags = check.tags
+        except Exception as e:
+            self._handle_check_error(check, e)
+            return None
+    
+    async def run_check_async(self, check_id: str) -> Optional[CheckResult]:
+        """
+        在事件循环中运行指定检查
+        同步检查通过run_in_executor放到线程池执行，不会阻塞其他异步检查
+        
+        Args:
+            check_id: 检查ID
             
-            check.last_run = result.timestamp
-            check.last_result = result
+        Returns:
+            检查结果，如果检查不存在则返回None
+        """
+        check = self._get_runnable_check(check_id)
+        if check is None:
+            return None
+        
+        try:
+            start_ns = time.monotonic_ns()
+            if isinstance(check, AsyncCheck):
+                result = await check.execute_async()
+            else:
+                loop = asyncio.get_running_loop()
+                result = await loop.run_in_executor(self._get_executor(check), check.execute)
+            return self._handle_result(check, result, start_ns)
             
-            # 更新统计
+        except Exception as e:
+            self._handle_check_error(check, e)
+            return None
+    
+    def _handle_result(self, check: Check, result: CheckResult, start_ns: int) -> CheckResult:
+        """
+        记录检查结果，更新统计并触发指标回调和告警
+        
+        Args:
+            check: 检查实例
+            result: 检查结果
+            start_ns: 检查开始时间（time.monotonic_ns()）
+            
+        Returns:
+            检查结果
+        """
+        # 带缓存的检查在间隔内返回已处理过的同一结果：保留原时间戳，不再重复记录历史、统计和告警
+        if result is check.last_result:
+            return result
+        
+        check_id = check.check_id
+        duration_ms = (time.monotonic_ns() - start_ns) / 1_000_000
+        
+        # 墙上时间只取一次，结果时间戳和告警ID共用
+        now_ns = time.time_ns()
+        
+        # 更新结果信息
+        result.duration_ms = duration_ms
+        result.timestamp = datetime.fromtimestamp(now_ns / 1_000_000_000)
+        result.tags = check.tags
+        
+        check.last_run = result.timestamp
+        check.last_run_ns = time.monotonic_ns()
+        check.last_run_iso = result.timestamp.isoformat()
+        
+        # 健康状态发生变化时增量更新健康计数
+        with self._checks_lock:
+            was_healthy = _is_healthy(check.last_result)
+            check.last_result = result
+            is_healthy = result.status == CheckStatus.HEALTHY
+            if was_healthy != is_healthy and check.enabled and self.checks.get(check_id) is check:
+                self._healthy_count += 1 if is_healthy else -1
+        
+        self.result_history.append(result)
+        
+        # 更新统计（检查可能在多个线程中并发执行）
+        with self._stats_lock:
             self.stats["last_check_time"] = result.timestamp
             if result.status == CheckStatus.HEALTHY:
                 self.stats["successful_checks"] += 1
             else:
                 self.stats["failed_checks"] += 1
-            
-            # 触发指标回调
-            for callback in self.metric_callbacks:
-                try:
-                    callback(result)
-                except Exception as e:
-                    logger.error(f"指标回调执行失败: {e}")
-            
-            # 根据状态触发告警
-            if result.status != CheckStatus.HEALTHY:
-                alert_level = self._status_to_alert_level(result.status)
-                alert = Alert(
-                    alert_id=f"alert_{check_id}_{int(time.time())}",
-                    level=alert_level,
-                    title=f"{check.check_name} 检查失败",
-                    message=result.message,
-                    source=check_id,
-                    timestamp=result.timestamp,
-                    context={"check_result": result.to_dict()}
-                )
-                self._trigger_alert(alert)
-            
-            logger.info(f"检查完成: {check_id} - {result.status.value} ({duration_ms:.1f}ms)")
-            return result
-            
-        except Exception as e:
-            logger.error(f"检查执行失败: {check_id}, 错误: {e}")
-            
-            # 创建错误告警
+        
+        # 触发指标回调
+        for callback in self.metric_callbacks:
+            try:
+                callback(result)
+            except Exception as e:
+                logger.error("指标回调执行失败: %s", e)
+        
+        for batcher in self._metric_batchers:
+            batcher.add(result)
+        
+        # 根据状态触发告警
+        if result.status != CheckStatus.HEALTHY:
+            alert_level = _STATUS_TO_LEVEL[result.status]
             alert = Alert(
-                alert_id=f"error_{check_id}_{int(time.time())}",
-                level=AlertLevel.ERROR,
-                title=f"{check.check_name} 检查异常",
-                message=f"检查执行时发生异常: {str(e)}",
+                alert_id=f"alert_{check_id}_{now_ns // 1_000_000_000}",
+                level=alert_level,
+                title=f"{check.check_name} 检查失败",
+                message=result.message,
                 source=check_id,
-                timestamp=datetime.now(),
-                context={"error": str(e), "check_id": check_id}
+                timestamp=result.timestamp,
+                result=result
             )
             self._trigger_alert(alert)
-            return None
+        
+        logger.info("检查完成: %s - %s (%.1fms)", check_id, result.status.value, duration_ms)
+        return result
+    
+    def _handle_check_error(self, check: Check, e: Exception):
+        """记录检查异常并触发错误告警"""
+        check_id = check.check_id
+        logger.error("检查执行失败: %s, 错误: %s", check_id, e)
+        
+        # 创建错误告警
+        now_ns = time.time_ns()
+        alert = Alert(
+            alert_id=f"error_{check_id}_{now_ns // 1_000_000_000}",
+            level=AlertLevel.ERROR,
+            title=f"{check.check_name} 检查异常",
+            message=f"检查执行时发生异常: {str(e)}",
+            source=check_id,
+            timestamp=datetime.fromtimestamp(now_ns / 1_000_000_000),
+            context={"error": str(e), "check_id": check_id}
+        )
+        self._trigger_alert(alert)
+    
+    def _get_loop(self) -> asyncio.AbstractEventLoop:
+        """获取运行异步检查的事件循环（首次使用时在独立线程中启动）"""
+        with self._executors_lock:
+            if self._loop is None:
+                self._loop = asyncio.new_event_loop()
+                self._loop_thread = threading.Thread(target=self._run_loop, args=(self._loop,),
+                                                     name="sitmon-async", daemon=True)
+                self._loop_thread.start()
+            return self._loop
+    
+    @staticmethod
+    def _run_loop(loop: asyncio.AbstractEventLoop):
+        """事件循环线程入口，停止时取消未完成的任务并关闭循环"""
+        asyncio.set_event_loop(loop)
+        try:
+            loop.run_forever()
+        finally:
+            pending = asyncio.all_tasks(loop)
+            for task in pending:
+                task.cancel()
+            if pending:
+                loop.run_until_complete(asyncio.gather(*pending, return_exceptions=True))
+            loop.close()
+    
+    def _shutdown_loop(self):
+        """停止事件循环线程（下次使用时会重新创建）"""
+        with self._executors_lock:
+            loop, thread = self._loop, self._loop_thread
+            self._loop = self._loop_thread = None
+        if loop is not None:
+            loop.call_soon_threadsafe(loop.stop)
+            thread.join(timeout=5)
+    
+    def _get_executor(self, check: Check) -> ThreadPoolExecutor:
+        """
+        获取检查对应的线程池
+        带有DEDICATED_POOL_TAGS标签的检查使用独立线程池，其余检查共用默认线程池
+        
+        Args:
+            check: 检查实例
+            
+        Returns:
+            线程池
+        """
+        pool_key = next((tag for tag in DEDICATED_POOL_TAGS if tag in check.tags), "default")
+        with self._executors_lock:
+            executor = self._executors.get(pool_key)
+            if executor is None:
+                executor = ThreadPoolExecutor(max_workers=CHECK_POOL_WORKERS,
+                                              thread_name_prefix=f"sitmon-{pool_key}")
+                self._executors[pool_key] = executor
+        return executor
+    
+    def _shutdown_executors(self):
+        """关闭所有检查线程池（下次使用时会重新创建）"""
+        with self._executors_lock:
+            executors = list(self._executors.values())
+            self._executors.clear()
+        for executor in executors:
+            executor.shutdown(wait=False)
     
     def run_all_checks(self) -> Dict[str, CheckResult]:
         """
-        运行所有检查
+        运行所有检查（并发执行，结果按检查注册顺序返回）
+        safe_for_parallel为False的检查在并发检查全部完成后依次运行
         
         Returns:
             检查结果字典
         """
+        enabled = self._enabled
+        futures = {
+            check.check_id: self._submit_check(check, self.run_check_async if isinstance(check, AsyncCheck) else self.run_check)
+            for check in enabled
+            if check.safe_for_parallel
+        }
+        
+        collected = {check_id: future.result() for check_id, future in futures.items()}
+        for check in enabled:
+            if not check.safe_for_parallel:
+                collected[check.check_id] = self._submit_check(
+                    check, self.run_check_async if isinstance(check, AsyncCheck) else self.run_check
+                ).result()
+        
         results = {}
-        for check_id in self.checks:
-            if self.checks[check_id].enabled:
-                result = self.run_check(check_id)
-                if result:
-                    results[check_id] = result
+        for check in enabled:
+            result = collected.get(check.check_id)
+            if result:
+                results[check.check_id] = result
         
         return results
     
+    def _schedule(self, check_id: str, deadline: float):
+        """
+        安排检查在指定时间运行，并唤醒监控循环重新计算等待时间
+        
+        Args:
+            check_id: 检查ID
+            deadline: 下次运行时间（time.monotonic()时钟）
+        """
+        with self._heap_lock:
+            self._next_run[check_id] = deadline
+            heapq.heappush(self._heap, (deadline, check_id))
+        self._wake.set()
+    
+    def _pop_due_checks(self, now: float) -> tuple:
+        """
+        弹出所有已到期的检查
+        
+        Args:
+            now: 当前monotonic时间
+            
+        Returns:
+            (到期的检查ID列表, 距下一个截止时间的等待秒数)
+        """
+        due = []
+        with self._heap_lock:
+            while self._heap and self._heap[0][0] <= now:
+                deadline, check_id = heapq.heappop(self._heap)
+                # 检查被重新安排或移除后，旧的堆条目直接丢弃
+                if self._next_run.get(check_id) != deadline:
+                    continue
+                del self._next_run[check_id]
+                check = self.checks.get(check_id)
+                if check is not None and check.enabled:
+                    due.append(check_id)
+            delay = self._heap[0][0] - now if self._heap else IDLE_WAIT_SECONDS
+        return due, delay
+    
+    def _submit_check(self, check: Check, runner: Callable) -> Future:
+        """
+        提交检查运行：异步检查提交到事件循环，同步检查提交到线程池
+        
+        Args:
+            check: 检查实例
+            runner: 以检查ID为参数的运行函数（异步检查需传入协程函数）
+            
+        Returns:
+            可等待结果的Future
+        """
+        if isinstance(check, AsyncCheck):
+            return asyncio.run_coroutine_threadsafe(runner(check.check_id), self._get_loop())
+        return self._get_executor(check).submit(runner, check.check_id)
+    
+    def _reschedule(self, check_id: str):
+        """检查运行结束后安排下一次运行"""
+        check = self.checks.get(check_id)
+        if check is not None and check.enabled:
+            self._schedule(check_id, time.monotonic() + check.interval_seconds)
+    
+    def _run_scheduled(self, check_id: str):
+        """在线程池中运行到期的检查，完成后安排下一次运行"""
+        try:
+            self.run_check(check_id)
+        finally:
+            self._reschedule(check_id)
+    
+    async def _run_scheduled_async(self, check_id: str):
+        """在事件循环中运行到期的异步检查，完成后安排下一次运行"""
+        try:
+            await self.run_check_async(check_id)
+        finally:
+            self._reschedule(check_id)
+    
     def _monitor_loop(self):
-        """监控循环"""
+        """监控循环（按下次运行时间的最小堆调度）"""
         logger.info("监控循环开始")
         
         while self.running:
             try:
-                # 运行所有启用的检查
-                for check_id, check in self.checks.items():
-                    if check.enabled:
-                        # 检查是否到了运行时间
-                        if check.last_run is None:
-                            # 第一次运行
-                            self.run_check(check_id)
-                        else:
-                            # 检查间隔是否已过
-                            time_since_last = (datetime.now() - check.last_run).total_seconds()
-                            if time_since_last >= check.interval_seconds:
-                                self.run_check(check_id)
+                # 先清除唤醒标志再查看堆，保证期间新增的调度不会丢失
+                self._wake.clear()
+                due, delay = self._pop_due_checks(time.monotonic())
                 
-                # 等待一段时间再检查
-                time.sleep(10)  # 每10秒检查一次哪些检查需要运行
+                if not due:
+                    self._wake.wait(timeout=delay)
+                    continue
+                
+                # 提交到线程池后立即返回，慢检查不会推迟其他检查的调度
+                for check_id in due:
+                    check = self.checks.get(check_id)
+                    if check is None:
+                        continue
+                    self._submit_check(check, self._run_scheduled_async if isinstance(check, AsyncCheck) else self._run_scheduled)
                 
             except Exception as e:
-                logger.error(f"监控循环异常: {e}")
-                time.sleep(30)  # 发生异常时等待更长时间
+                logger.error("监控循环异常: %s", e)
+                self._wake.wait(timeout=30)  # 发生异常时等待更长时间，stop()可随时唤醒
     
     def start(self):
         """启动监控"""
@@ -340,53 +885,50 @@ class SituationMonitor:
             return
         
         self.running = True
+        self._alert_thread = threading.Thread(target=self._alert_dispatch_loop,
+                                              name="sitmon-alerts", daemon=True)
+        self._alert_thread.start()
         self.monitor_thread = threading.Thread(target=self._monitor_loop, daemon=True)
         self.monitor_thread.start()
-        logger.info(f"情境监控器启动: {self.monitor_id}")
+        logger.info("情境监控器启动: %s", self.monitor_id)
     
     def stop(self):
         """停止监控"""
         self.running = False
+        self._wake.set()
         if self.monitor_thread:
             self.monitor_thread.join(timeout=5)
-        logger.info(f"情境监控器停止: {self.monitor_id}")
+        
+        self._shutdown_loop()
+        self._shutdown_executors()
+        self._stop_alert_dispatcher()
+        self.flush_metrics()
+        
+        # 释放各检查持有的资源
+        for check in self.checks.values():
+            try:
+                check.close()
+            except Exception as e:
+                logger.error("释放检查资源失败: %s, 错误: %s", check.check_id, e)
+        
+        logger.info("情境监控器停止: %s", self.monitor_id)
     
-    def get_status(self) -> Dict[str, Any]:
+    def get_status(self, verbose: bool = True) -> Dict[str, Any]:
         """
         获取监控器状态
         
+        Args:
+            verbose: 是否包含每个检查的详细状态（False时只返回汇总计数）
+        
         Returns:
             状态信息
         """
-        now = datetime.now()
-        
-        # 计算检查状态
-        check_statuses = {}
-        for check_id, check in self.checks.items():
-            status = {
-                "enabled": check.enabled,
-                "interval": check.interval_seconds,
-                "last_run": check.last_run.isoformat() if check.last_run else None,
-                "last_status": check.last_result.status.value if check.last_result else None
-            }
-            
-            # 检查是否超时
-            if check.last_run:
-                seconds_since_last = (now - check.last_run).total_seconds()
-                status["seconds_since_last"] = seconds_since_last
-                status["timed_out"] = seconds_since_last > check.interval_seconds * 1.5
-            
-            check_statuses[check_id] = status
-        
-        # 计算整体健康状态
-        healthy_checks = 0
-        total_enabled = 0
+        now_ns = time.monotonic_ns()
         
-        for check_id, status in check_statuses.items():
-            if status["enabled"]:
-                total_enabled += 1
-                if status["last_status"] == "healthy":
-                    healthy_checks += 1
+        # 计算整体健康状态（计数在检查运行和增删启停时增量维护）
+        with self._checks_lock:
+            total_enabled = len(self._enabled)
+            healthy_checks = self._healthy_count
         
         overall_health = "unknown"
         if total_enabled > 0:
@@ -398,38 +940,141 @@ class SituationMonitor:
             else:
                 overall_health = "critical"
         
-        return {
+        status_info = {
             "monitor_id": self.monitor_id,
             "running": self.running,
             "overall_health": overall_health,
             "check_count": len(self.checks),
             "enabled_check_count": total_enabled,
             "healthy_check_count": healthy_checks,
-            "check_statuses": check_statuses,
             "stats": self.stats,
-            "uptime_seconds": (now - self.stats["start_time"]).total_seconds()
+            "uptime_seconds": (now_ns - self._start_ns) / 1_000_000_000
         }
+        
+        if verbose:
+            status_info["check_statuses"] = self._build_check_statuses(now_ns)
+        
+        return status_info
     
-    def _status_to_alert_level(self, status: CheckStatus) -> AlertLevel:
-        """将检查状态转换为告警级别"""
-        mapping = {
-            CheckStatus.HEALTHY: AlertLevel.INFO,
-            CheckStatus.WARNING: AlertLevel.WARNING,
-            CheckStatus.ERROR: AlertLevel.ERROR,
-            CheckStatus.CRITICAL: AlertLevel.CRITICAL,
-            CheckStatus.UNKNOWN: AlertLevel.WARNING
-        }
-        return mapping.get(status, AlertLevel.WARNING)
+    def _build_check_statuses(self, now_ns: int) -> Dict[str, Dict[str, Any]]:
+        """
+        构建每个检查的详细状态
+        
+        Args:
+            now_ns: 当前time.monotonic_ns()
+            
+        Returns:
+            检查ID到状态信息的映射
+        """
+        check_statuses = {}
+        for check_id, check in list(self.checks.items()):
+            status = {
+                "enabled": check.enabled,
+                "interval": check.interval_seconds,
+                "last_run": check.last_run_iso,
+                "last_status": check.last_result.status.value if check.last_result else None
+            }
+            
+            # 检查是否超时
+            if check.last_run_ns is not None:
+                seconds_since_last = (now_ns - check.last_run_ns) / 1_000_000_000
+                status["seconds_since_last"] = seconds_since_last
+                status["timed_out"] = seconds_since_last > check.interval_seconds * 1.5
+            
+            check_statuses[check_id] = status
+        
+        return check_statuses
+    
+    def get_recent_results(self, n: int = 10) -> List[CheckResult]:
+        """
+        获取最近的检查结果
+        
+        Args:
+            n: 返回数量
+            
+        Returns:
+            检查结果列表（按时间从旧到新）
+        """
+        return list(self.result_history)[-n:] if n > 0 else []
+    
+    def get_recent_alerts(self, n: int = 10) -> List[Alert]:
+        """
+        获取最近触发的告警
+        
+        Args:
+            n: 返回数量
+            
+        Returns:
+            告警列表（按时间从旧到新）
+        """
+        return list(self.alert_history)[-n:] if n > 0 else []
+    
+    def _should_suppress_alert(self, alert: Alert) -> bool:
+        """
+        判断告警是否处于去重窗口内
+        级别变化的告警使用不同的键，因此升级后的告警不会被抑制
+        
+        Args:
+            alert: 告警
+            
+        Returns:
+            需要抑制时返回True
+        """
+        key = (alert.source, alert.title, alert.level)
+        now = time.monotonic()
+        with self._alert_window_lock:
+            last = self._alert_window.get(key)
+            if last is not None and now - last < self.alert_min_interval:
+                return True
+            self._alert_window[key] = now
+        return False
     
     def _trigger_alert(self, alert: Alert):
-        """触发告警"""
-        logger.info(f"触发告警: {alert.level.value} - {alert.title}")
+        """触发告警（监控运行期间放入队列异步分发，否则直接分发）"""
+        if self._should_suppress_alert(alert):
+            logger.debug("告警已抑制: %s - %s", alert.level.value, alert.title)
+            return
+        
+        logger.info("触发告警: %s - %s", alert.level.value, alert.title)
+        self.alert_history.append(alert)
         
+        if self._alert_thread is not None:
+            self._alert_queue.put(alert)
+        else:
+            self._dispatch_alert(alert)
+    
+    def _dispatch_alert(self, alert: Alert):
+        """依次调用告警回调"""
         for callback in self.alert_callbacks:
             try:
                 callback(alert)
             except Exception as e:
-                logger.error(f"告警回调执行失败: {e}")
+                logger.error("告警回调执行失败: %s", e)
+    
+    def _alert_dispatch_loop(self):
+        """告警分发线程，收到None时退出"""
+        while True:
+            alert = self._alert_queue.get()
+            if alert is None:
+                break
+            self._dispatch_alert(alert)
+    
+    def _stop_alert_dispatcher(self):
+        """停止告警分发线程，并直接分发队列中剩余的告警"""
+        thread, self._alert_thread = self._alert_thread, None
+        if thread is None:
+            return
+        
+        self._alert_queue.put(None)
+        thread.join(timeout=5)
+        
+        while True:
+            try:
+                alert = self._alert_queue.get_nowait()
+            except queue.Empty:
+                break
+            if alert is not None:
+                self._dispatch_alert(alert)
     
     def __enter__(self):
         """上下文管理器入口"""
@@ -448,21 +1093,69 @@ class SituationMonitor:
 class SystemHealthCheck(Check):
     """系统健康检查示例"""
     
+    # 健康阈值表：(指标键, 警告阈值, 严重阈值, 警告描述, 严重描述)
+    THRESHOLDS = (
+        ("cpu_percent", 80, 90, "CPU使用率偏高", "CPU使用率过高"),
+        ("memory_percent", 80, 90, "内存使用率偏高", "内存使用率过高"),
+        ("disk_percent", 90, 95, "磁盘空间紧张", "磁盘空间不足"),
+    )
+    
+    # 磁盘使用率缓存时间（秒），磁盘占用变化缓慢，无需每次检查都读取
+    DISK_CACHE_SECONDS = 30
+    
     def __init__(self):
         super().__init__("system_health", "系统健康检查", interval_seconds=300)
         self.add_tag("system")
         self.add_tag("health")
+        self._disk_cache: Optional[tuple] = None  # (monotonic时间, disk_usage结果)
+        
+        # 上次检查时的CPU时间(总时间, 空闲时间)，保存在实例上而不依赖psutil按线程保存的状态，
+        # 检查在监控器的任意工作线程中执行都能得到两次检查之间的使用率
+        self._last_cpu_times: Optional[tuple] = self._read_cpu_times() if PSUTIL_AVAILABLE else None
+    
+    @staticmethod
+    def _read_cpu_times() -> tuple:
+        """读取整体CPU时间，返回(总时间, 空闲时间)，iowait计为空闲（与psutil.cpu_percent一致）"""
+        times = psutil.cpu_times()
+        idle = times.idle + getattr(times, "iowait", 0.0)
+        return sum(times), idle
+    
+    def _cpu_percent(self) -> float:
+        """自上次检查以来的CPU使用率"""
+        total, idle = self._read_cpu_times()
+        last_total, last_idle = self._last_cpu_times
+        self._last_cpu_times = (total, idle)
+        
+        delta_total = total - last_total
+        if delta_total <= 0:
+            return 0.0
+        busy = delta_total - (idle - last_idle)
+        return round(min(100.0, max(0.0, busy / delta_total * 100)), 1)
+    
+    def _get_disk_usage(self):
+        """获取根分区使用情况（带缓存）"""
+        now = time.monotonic()
+        if self._disk_cache is None or now - self._disk_cache[0] >= self.DISK_CACHE_SECONDS:
+            self._disk_cache = (now, psutil.disk_usage('/'))
+        return self._disk_cache[1]
     
     def execute(self) -> CheckResult:
         """执行系统健康检查"""
-        import psutil
-        import os
+        if not PSUTIL_AVAILABLE:
+            return CheckResult(
+                check_id=self.check_id,
+                check_name=self.check_name,
+                status=CheckStatus.UNKNOWN,
+                message="psutil未安装，无法检查系统健康",
+                metrics={},
+                timestamp=datetime.now()
+            )
         
         metrics = {}
         
         try:
-            # CPU使用率
-            cpu_percent = psutil.cpu_percent(interval=0.1)
+            # CPU使用率（自上次检查以来的平均值）
+            cpu_percent = self._cpu_percent()
             metrics["cpu_percent"] = cpu_percent
             
             # 内存使用率
@@ -471,7 +1164,7 @@ class SystemHealthCheck(Check):
             metrics["memory_available_gb"] = memory.available / (1024**3)
             
             # 磁盘使用率
-            disk = psutil.disk_usage('/')
+            disk = self._get_disk_usage()
             metrics["disk_percent"] = disk.percent
             metrics["disk_free_gb"] = disk.free / (1024**3)
             
@@ -482,28 +1175,19 @@ class SystemHealthCheck(Check):
                 metrics["load_avg_5min"] = load_avg[1]
                 metrics["load_avg_15min"] = load_avg[2]
             
-            # 判断状态
+            # 判断状态（任一指标严重即为严重，否则取第一个警告）
             status = CheckStatus.HEALTHY
             message = "系统运行正常"
             
-            if cpu_percent > 90:
-                status = CheckStatus.CRITICAL
-                message = f"CPU使用率过高: {cpu_percent}%"
-            elif cpu_percent > 80:
-                status = CheckStatus.WARNING
-                message = f"CPU使用率偏高: {cpu_percent}%"
-            elif memory.percent > 90:
-                status = CheckStatus.CRITICAL
-                message = f"内存使用率过高: {memory.percent}%"
-            elif memory.percent > 80:
-                status = CheckStatus.WARNING
-                message = f"内存使用率偏高: {memory.percent}%"
-            elif disk.percent > 95:
-                status = CheckStatus.CRITICAL
-                message = f"磁盘空间不足: {disk.percent}%"
-            elif disk.percent > 90:
-                status = CheckStatus.WARNING
-                message = f"磁盘空间紧张: {disk.percent}%"
+            for key, warn, crit, warn_label, crit_label in self.THRESHOLDS:
+                value = metrics[key]
+                if value > crit:
+                    status = CheckStatus.CRITICAL
+                    message = f"{crit_label}: {value}%"
+                    break
+                if value > warn and status == CheckStatus.HEALTHY:
+                    status = CheckStatus.WARNING
+                    message = f"{warn_label}: {value}%"
             
             return CheckResult(
                 check_id=self.check_id,
@@ -511,8 +1195,7 @@ class SystemHealthCheck(Check):
                 status=status,
                 message=message,
                 metrics=metrics,
-                timestamp=datetime.now(),
-                duration_ms=0  # 将在监控器中计算
+                timestamp=datetime.now()
             )
             
         except Exception as e:
@@ -522,8 +1205,7 @@ class SystemHealthCheck(Check):
                 status=CheckStatus.ERROR,
                 message=f"系统健康检查失败: {str(e)}",
                 metrics={},
-                timestamp=datetime.now(),
-                duration_ms=0
+                timestamp=datetime.now()
             )
 
 
@@ -4,45 +4,109 @@
 提供向后兼容的接口，内部使用situation-monitor架构
 """
 
-import time
-import sys
 import os
+import sys
+import time
+import threading
+from collections import Counter
+from concurrent.futures import ThreadPoolExecutor, TimeoutError as FuturesTimeoutError
 from datetime import datetime
-from typing import Dict, List, Any, Optional
+from typing import Dict, List, Any, Optional, Callable, Tuple
 
-# 添加父目录到路径
-sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.dirname(os.path.abspath(__file__)))))
 
-try:
-    from situation_monitor.core.monitor import SituationMonitor
-    from situation_monitor.checks.system_checks import (
-        DatabaseCheck, MessagePlatformCheck, 
-        SystemResourcesCheck, EnhancedSystemResourcesCheck
-    )
-    from utils.logger import Logger
-except ImportError as e:
-    print(f"[LegacyAdapter] 导入模块失败: {e}")
-    
-    # 创建简单的替代类
-    class SituationMonitor:
-        def __init__(self, monitor_id="default"):
-            self.monitor_id = monitor_id
-        
-        def add_check(self, check):
-            pass
-        
-        def run_all_checks(self):
-            return {}
-        
-        def get_status(self):
-            return {"overall_health": "unknown"}
+# 监控栈在首次构造LegacyHealthChecker时才导入（见__init__），
+# 只使用generate_summary等纯格式化接口时不必承担导入开销。
+# src目录（作为脚本直接运行时用于绝对导入，也是utils包所在目录）
+_SRC_DIR = os.path.dirname(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+
+def _ensure_src_path():
+    """把src目录加入sys.path（作为脚本直接运行时没有父包，只能使用绝对导入）"""
+    if _SRC_DIR not in sys.path:
+        sys.path.insert(0, _SRC_DIR)
+
+
+# utils.logger不可用时使用的简单替代类
+class _FallbackLogger:
+    def __init__(self, name):
+        self.name = name
     
-    class Logger:
-        def __init__(self, name):
-            self.name = name
-        
-        def info(self, msg):
-            print(f"[{self.name}] INFO: {msg}")
+    def info(self, msg):
+        print(f"[{self.name}] INFO: {msg}")
+
+
+# situation-monitor检查状态到旧接口状态的映射
+_STATUS_MAP = {
+    "healthy": "healthy",
+    "warning": "warning",
+    "error": "unhealthy",
+    "critical": "unhealthy",
+    "unknown": "unknown"
+}
+
+# 计入熔断失败次数的检查状态（situation-monitor状态值）
+_FAILED_CHECK_STATUSES = frozenset(("error", "critical"))
+
+# 健康报告中固定统计的状态
+_STATUS_KEYS = ("healthy", "warning", "unhealthy", "unknown")
+
+# 摘要中的状态表情符号
+_STATUS_EMOJI = {
+    "healthy": "✅",
+    "warning": "⚠️",
+    "unhealthy": "❌",
+    "unknown": "❓"
+}
+
+# 摘要中需要列为问题的状态
+_BAD_STATUSES = frozenset(("unhealthy", "warning"))
+
+# 摘要中最多列出的问题数
+MAX_SUMMARY_ISSUES = 5
+
+# check_all/check_quick等待全部组件检查完成的最长时间（秒）
+CHECK_TIMEOUT = 30
+
+# 各组件检查并发执行的线程池，所有适配器实例共享（每个组件检查自身有超时，不会长期占用线程）
+_COMPONENT_POOL = ThreadPoolExecutor(max_workers=4, thread_name_prefix="legacy-hc")
+
+# 熔断：连续失败达到次数后，在冷却时间内直接返回上次的失败结果而不再探测
+BREAKER_FAILURE_THRESHOLD = 3
+BREAKER_COOLDOWN_SECONDS = 30
+
+# 新闻源检查结果中不随调用变化的部分（快速检查模式下跳过新闻源检查）
+_NEWS_SOURCES_BASE: Dict[str, Any] = {
+    "component": "news_sources",
+    "status": "healthy",  # 假设正常，避免耗时检查
+    "details": {
+        "message": "新闻源检查已跳过（快速检查模式）",
+        "total_count": 36,
+        "working_count": 36,
+        "skipped": True
+    }
+}
+
+# 最近一次格式化的时间戳：(整秒时间, ISO字符串)
+_ts_cache: Tuple[int, str] = (0, "")
+
+
+def _enhanced_extras(metrics: Dict[str, Any]) -> Dict[str, Any]:
+    """提取增强版系统资源检查的摘要、警告和严重问题"""
+    return {
+        "summary": metrics.get("summary", ""),
+        "warnings": metrics.get("warnings", []),
+        "criticals": metrics.get("criticals", [])
+    }
+
+
+def _iso_now() -> str:
+    """当前时间的ISO格式字符串（秒级精度，同一秒内复用已格式化的字符串）"""
+    global _ts_cache
+    now = int(time.time())
+    cached = _ts_cache
+    if cached[0] != now:
+        cached = _ts_cache = (now, datetime.fromtimestamp(now).isoformat())
+    return cached[1]
 
 
 class LegacyHealthChecker:
@@ -51,6 +115,27 @@ class LegacyHealthChecker:
     提供原有HealthChecker接口，内部使用situation-monitor
     """
     
+    __slots__ = (
+        "config_dir", "logger", "monitor", "_cache", "_cache_locks",
+        "_probes", "_fail_count", "_breaker_open_until", "_last_failure"
+    )
+    
+    # 各组件检查结果的缓存时间（秒），短时间内的重复调用直接返回缓存结果
+    _TTL = {
+        "database": 5,
+        "message_platforms": 10,
+        "system_resources": 5,
+        "system_resources_enhanced": 15
+    }
+    
+    # 单个组件检查的超时时间（秒）
+    _TIMEOUTS = {
+        "database": 5,
+        "message_platforms": 10,
+        "system_resources": 5,
+        "system_resources_enhanced": 10
+    }
+    
     def __init__(self, config_dir: str = "config"):
         """
         初始化适配器
@@ -59,11 +144,39 @@ class LegacyHealthChecker:
             config_dir: 配置目录路径（为了兼容性保留）
         """
         self.config_dir = config_dir
+        
+        try:
+            from ..core.monitor import SituationMonitor, ProbeRunner
+        except ImportError:
+            _ensure_src_path()
+            from situation_monitor.core.monitor import SituationMonitor, ProbeRunner
+        
+        # 只有日志模块允许缺失，监控栈导入失败直接抛出
+        try:
+            from utils.logger import Logger
+        except ModuleNotFoundError as e:
+            if e.name not in ("utils", "utils.logger"):
+                raise
+            print(f"[LegacyAdapter] 导入日志模块失败: {e}")
+            Logger = _FallbackLogger
+        
         self.logger = Logger(__name__)
         
         # 创建situation-monitor实例
         self.monitor = SituationMonitor("legacy_compatibility")
         
+        # 检查结果缓存：组件名 -> (monotonic时间, 结果)；每个组件一把锁，并发请求共享同一次检查
+        self._cache: Dict[str, Tuple[float, Dict[str, Any]]] = {}
+        self._cache_locks = {name: threading.Lock() for name in self._TTL}
+        
+        # 底层检查在守护线程中运行以施加超时，每个组件同时最多一个探测
+        self._probes = ProbeRunner("legacy-probe")
+        
+        # 熔断状态
+        self._fail_count: Dict[str, int] = {}
+        self._breaker_open_until: Dict[str, float] = {}
+        self._last_failure: Dict[str, Dict[str, Any]] = {}
+        
         # 添加默认检查
         self._setup_default_checks()
         
@@ -71,6 +184,18 @@ class LegacyHealthChecker:
     
     def _setup_default_checks(self):
         """设置默认检查"""
+        try:
+            from ..checks.system_checks import (
+                DatabaseCheck, MessagePlatformCheck,
+                SystemResourcesCheck, EnhancedSystemResourcesCheck
+            )
+        except ImportError:
+            _ensure_src_path()
+            from situation_monitor.checks.system_checks import (
+                DatabaseCheck, MessagePlatformCheck,
+                SystemResourcesCheck, EnhancedSystemResourcesCheck
+            )
+        
         checks = [
             DatabaseCheck(),
             MessagePlatformCheck(),
@@ -88,41 +213,7 @@ class LegacyHealthChecker:
         Returns:
             数据库检查结果
         """
-        result = {
-            "component": "database",
-            "status": "unknown",
-            "details": {},
-            "timestamp": datetime.now().isoformat()
-        }
-        
-        try:
-            # 运行数据库检查
-            check_result = self.monitor.run_check("database")
-            
-            if check_result:
-                # 转换为原有格式
-                status_mapping = {
-                    "healthy": "healthy",
-                    "warning": "warning", 
-                    "error": "unhealthy",
-                    "critical": "unhealthy",
-                    "unknown": "unknown"
-                }
-                
-                result["status"] = status_mapping.get(check_result.status.value, "unknown")
-                result["details"] = {
-                    "metrics": check_result.metrics,
-                    "message": check_result.message
-                }
-            else:
-                result["status"] = "unhealthy"
-                result["details"] = {"error": "数据库检查失败"}
-                
-        except Exception as e:
-            result["status"] = "unhealthy"
-            result["details"] = {"error": f"数据库检查异常: {str(e)}"}
-        
-        return result
+        return self._cached("database", lambda: self._run_mapped("database", "数据库"))
     
     def check_message_platforms(self) -> Dict[str, Any]:
         """
@@ -131,40 +222,8 @@ class LegacyHealthChecker:
         Returns:
             消息平台检查结果
         """
-        result = {
-            "component": "message_platforms",
-            "status": "unknown",
-            "details": {},
-            "timestamp": datetime.now().isoformat()
-        }
-        
-        try:
-            # 运行消息平台检查
-            check_result = self.monitor.run_check("message_platforms")
-            
-            if check_result:
-                status_mapping = {
-                    "healthy": "healthy",
-                    "warning": "warning",
-                    "error": "unhealthy",
-                    "critical": "unhealthy",
-                    "unknown": "unknown"
-                }
-                
-                result["status"] = status_mapping.get(check_result.status.value, "unknown")
-                result["details"] = {
-                    "metrics": check_result.metrics,
-                    "message": check_result.message
-                }
-            else:
-                result["status"] = "warning"
-                result["details"] = {"error": "消息平台检查失败"}
-                
-        except Exception as e:
-            result["status"] = "warning"
-            result["details"] = {"error": f"消息平台检查异常: {str(e)}"}
-        
-        return result
+        return self._cached("message_platforms", lambda: self._run_mapped(
+            "message_platforms", "消息平台", failure_status="warning"))
     
     def check_system_resources(self) -> Dict[str, Any]:
         """
@@ -173,40 +232,8 @@ class LegacyHealthChecker:
         Returns:
             系统资源检查结果
         """
-        result = {
-            "component": "system_resources",
-            "status": "unknown",
-            "details": {},
-            "timestamp": datetime.now().isoformat()
-        }
-        
-        try:
-            # 运行系统资源检查
-            check_result = self.monitor.run_check("system_resources")
-            
-            if check_result:
-                status_mapping = {
-                    "healthy": "healthy",
-                    "warning": "warning",
-                    "error": "unhealthy",
-                    "critical": "unhealthy",
-                    "unknown": "unknown"
-                }
-                
-                result["status"] = status_mapping.get(check_result.status.value, "unknown")
-                result["details"] = {
-                    "metrics": check_result.metrics,
-                    "message": check_result.message
-                }
-            else:
-                result["status"] = "warning"
-                result["details"] = {"error": "系统资源检查失败"}
-                
-        except Exception as e:
-            result["status"] = "warning"
-            result["details"] = {"error": f"系统资源检查异常: {str(e)}"}
-        
-        return result
+        return self._cached("system_resources", lambda: self._run_mapped(
+            "system_resources", "系统资源", failure_status="warning"))
     
     def check_system_resources_enhanced(self) -> Dict[str, Any]:
         """
@@ -215,46 +242,117 @@ class LegacyHealthChecker:
         Returns:
             增强版系统资源检查结果
         """
+        return self._cached("system_resources_enhanced", lambda: self._run_mapped(
+            "system_resources_enhanced", "增强版系统资源", failure_status="warning",
+            error_status="unhealthy", extract_extras=_enhanced_extras, expose_metrics=True))
+    
+    def _run_mapped(self, check_name: str, label: str, failure_status: str = "unhealthy",
+                    error_status: Optional[str] = None,
+                    extract_extras: Optional[Callable[[Dict[str, Any]], Dict[str, Any]]] = None,
+                    expose_metrics: bool = False) -> Dict[str, Any]:
+        """
+        运行situation-monitor检查并转换为旧接口格式
+        
+        Args:
+            check_name: 检查ID（同时作为组件名）
+            label: 错误信息中使用的组件描述
+            failure_status: 检查未返回结果时的状态
+            error_status: 检查抛出异常时的状态，默认与failure_status相同
+            extract_extras: 从指标中提取附加详情的函数
+            expose_metrics: 是否在结果顶层附带完整指标
+            
+        Returns:
+            旧接口格式的检查结果
+        """
         result = {
-            "component": "system_resources_enhanced",
+            "component": check_name,
             "status": "unknown",
             "details": {},
-            "timestamp": datetime.now().isoformat(),
-            "metrics": {}
+            "timestamp": _iso_now()
         }
+        if expose_metrics:
+            result["metrics"] = {}
+        
+        # 熔断期间直接返回上次的失败结果
+        if time.monotonic() < self._breaker_open_until.get(check_name, 0):
+            return {**self._last_failure[check_name], "timestamp": result["timestamp"]}
         
+        timeout = self._TIMEOUTS[check_name]
         try:
-            # 运行增强版系统资源检查
-            check_result = self.monitor.run_check("system_resources_enhanced")
+            # 上一次探测仍未结束时等待同一个探测，不再启动新线程
+            future = self._probes.submit(check_name, self.monitor.run_check, check_name)
+            check_result = future.result(timeout=timeout)
             
             if check_result:
-                status_mapping = {
-                    "healthy": "healthy",
-                    "warning": "warning",
-                    "error": "unhealthy",
-                    "critical": "unhealthy",
-                    "unknown": "unknown"
-                }
-                
-                result["status"] = status_mapping.get(check_result.status.value, "unknown")
-                result["details"] = {
+                # 转换为原有格式
+                result["status"] = _STATUS_MAP.get(check_result.status.value, "unknown")
+                details = {
                     "metrics": check_result.metrics,
-                    "message": check_result.message,
-                    "summary": check_result.metrics.get("summary", ""),
-                    "warnings": check_result.metrics.get("warnings", []),
-                    "criticals": check_result.metrics.get("criticals", [])
+                    "message": check_result.message
                 }
-                result["metrics"] = check_result.metrics
+                if extract_extras is not None:
+                    details.update(extract_extras(check_result.metrics))
+                result["details"] = details
+                if expose_metrics:
+                    result["metrics"] = check_result.metrics
             else:
-                result["status"] = "warning"
-                result["details"] = {"error": "增强版系统资源检查失败"}
+                # 检查内部异常时run_check返回None
+                result["status"] = failure_status
+                result["details"] = {"error": f"{label}检查失败"}
+            
+            # 只有健康结果才清零失败计数，返回None或错误状态都计入熔断
+            if check_result is None or check_result.status.value in _FAILED_CHECK_STATUSES:
+                self._record_failure(check_name, result)
+            elif check_result.status.value == "healthy":
+                self._fail_count[check_name] = 0
+            return result
                 
-        except Exception as e:
+        except FuturesTimeoutError:
             result["status"] = "unhealthy"
-            result["details"] = {"error": f"增强版系统资源检查异常: {str(e)}"}
+            result["details"] = {"error": f"{label}检查超时（{timeout}秒）"}
+        except Exception as e:
+            result["status"] = error_status or failure_status
+            result["details"] = {"error": f"{label}检查异常: {str(e)}"}
         
+        self._record_failure(check_name, result)
         return result
     
+    def _record_failure(self, check_name: str, result: Dict[str, Any]):
+        """
+        记录检查失败（超时、异常、无结果或错误状态），连续失败达到阈值时打开熔断
+        
+        Args:
+            check_name: 检查ID
+            result: 本次失败的检查结果
+        """
+        self._last_failure[check_name] = result
+        count = self._fail_count.get(check_name, 0) + 1
+        self._fail_count[check_name] = count
+        if count >= BREAKER_FAILURE_THRESHOLD:
+            self._breaker_open_until[check_name] = time.monotonic() + BREAKER_COOLDOWN_SECONDS
+            self._fail_count[check_name] = 0
+            self.logger.info(f"{check_name}检查连续失败{count}次，{BREAKER_COOLDOWN_SECONDS}秒内暂停探测")
+    
+    def _cached(self, name: str, fn: Callable[[], Dict[str, Any]]) -> Dict[str, Any]:
+        """
+        带TTL缓存地执行组件检查
+        
+        Args:
+            name: 组件名（缓存时间见_TTL）
+            fn: 实际执行检查的函数
+            
+        Returns:
+            检查结果（缓存未过期时直接返回缓存）
+        """
+        with self._cache_locks[name]:
+            entry = self._cache.get(name)
+            if entry is not None and time.monotonic() - entry[0] < self._TTL[name]:
+                return entry[1]
+            
+            result = fn()
+            self._cache[name] = (time.monotonic(), result)
+            return result
+    
     def check_news_sources(self) -> Dict[str, Any]:
         """
         检查新闻源（为了兼容性保留，暂不实现详细检查）
@@ -264,54 +362,65 @@ class LegacyHealthChecker:
         """
         # 注意：为了快速检查，我们跳过新闻源检查
         # 这符合原有check_quick()的逻辑
+        # details每次复制一份，调用方修改报告时不会改动模块常量
         return {
-            "component": "news_sources",
-            "status": "healthy",  # 假设正常，避免耗时检查
-            "details": {
-                "message": "新闻源检查已跳过（快速检查模式）",
-                "total_count": 36,
-                "working_count": 36,
-                "skipped": True
-            },
-            "timestamp": datetime.now().isoformat()
+            **_NEWS_SOURCES_BASE,
+            "details": dict(_NEWS_SOURCES_BASE["details"]),
+            "timestamp": _iso_now()
         }
     
-    def check_all(self) -> Dict[str, Any]:
+    def _run_components(self, components: Tuple[Tuple[str, Callable[[], Dict[str, Any]]], ...],
+                        timestamp: str) -> Dict[str, Dict[str, Any]]:
         """
-        执行所有健康检查（兼容原有接口）
+        并发执行多个组件检查
         
+        Args:
+            components: (组件名, 检查函数)元组，结果按此顺序返回
+            timestamp: 报告时间戳（用于超时组件的结果）
+            
         Returns:
-            完整的健康检查报告
+            组件名到检查结果的映射，超时的组件记为unhealthy
         """
-        start_time = time.time()
-        
-        # 执行各项检查
-        checks = {
-            "database": self.check_database(),
-            "news_sources": self.check_news_sources(),
-            "message_platforms": self.check_message_platforms(),
-            "system_resources": self.check_system_resources()
-        }
+        futures = {name: _COMPONENT_POOL.submit(fn) for name, fn in components}
+        deadline = time.monotonic() + CHECK_TIMEOUT
+        
+        checks = {}
+        for name, future in futures.items():
+            try:
+                checks[name] = future.result(timeout=max(0, deadline - time.monotonic()))
+            except FuturesTimeoutError:
+                checks[name] = {
+                    "component": name,
+                    "status": "unhealthy",
+                    "details": {"error": f"检查超时（{CHECK_TIMEOUT}秒）"},
+                    "timestamp": timestamp
+                }
         
-        # 计算整体状态
-        status_counts = {"healthy": 0, "warning": 0, "unhealthy": 0, "unknown": 0}
+        return checks
+    
+    def _build_report(self, checks: Dict[str, Dict[str, Any]], start_time: float, timestamp: str) -> Dict[str, Any]:
+        """
+        根据各组件检查结果生成健康检查报告
         
-        for check_name, check_result in checks.items():
-            status = check_result.get("status", "unknown")
-            status_counts[status] = status_counts.get(status, 0) + 1
+        Args:
+            checks: 组件名到检查结果的映射
+            start_time: 检查开始时间（time.time()）
+            timestamp: 报告时间戳
+            
+        Returns:
+            健康检查报告
+        """
+        # 计算整体状态（固定包含四种标准状态的计数）
+        status_counts = dict.fromkeys(_STATUS_KEYS, 0)
+        status_counts.update(Counter(check_result.get("status", "unknown") for check_result in checks.values()))
         
         # 确定整体状态
-        if status_counts["unhealthy"] > 0:
-            overall_status = "unhealthy"
-        elif status_counts["warning"] > 0:
-            overall_status = "warning"
-        else:
-            overall_status = "healthy"
+        overall_status = "unhealthy" if status_counts["unhealthy"] else ("warning" if status_counts["warning"] else "healthy")
         
         # 生成报告
         report = {
             "overall_status": overall_status,
-            "timestamp": datetime.now().isoformat(),
+            "timestamp": timestamp,
             "check_time_seconds": round(time.time() - start_time, 2),
             "status_counts": status_counts,
             "checks": checks
@@ -319,6 +428,26 @@ class LegacyHealthChecker:
         
         return report
     
+    def check_all(self) -> Dict[str, Any]:
+        """
+        执行所有健康检查（兼容原有接口）
+        
+        Returns:
+            完整的健康检查报告
+        """
+        start_time = time.time()
+        timestamp = _iso_now()
+        
+        # 并发执行各项检查
+        checks = self._run_components((
+            ("database", self.check_database),
+            ("news_sources", self.check_news_sources),
+            ("message_platforms", self.check_message_platforms),
+            ("system_resources", self.check_system_resources)
+        ), timestamp)
+        
+        return self._build_report(checks, start_time, timestamp)
+    
     def check_quick(self) -> Dict[str, Any]:
         """
         快速健康检查（兼容原有接口）
@@ -328,39 +457,16 @@ class LegacyHealthChecker:
             快速健康检查报告
         """
         start_time = time.time()
+        timestamp = _iso_now()
         
-        # 只检查核心组件
-        checks = {
-            "database": self.check_database(),
-            "message_platforms": self.check_message_platforms(),
-            "system_resources": self.check_system_resources_enhanced()
-        }
+        # 只检查核心组件（并发执行）
+        checks = self._run_components((
+            ("database", self.check_database),
+            ("message_platforms", self.check_message_platforms),
+            ("system_resources", self.check_system_resources_enhanced)
+        ), timestamp)
         
-        # 计算整体状态
-        status_counts = {"healthy": 0, "warning": 0, "unhealthy": 0, "unknown": 0}
-        
-        for check_name, check_result in checks.items():
-            status = check_result.get("status", "unknown")
-            status_counts[status] = status_counts.get(status, 0) + 1
-        
-        # 确定整体状态
-        if status_counts["unhealthy"] > 0:
-            overall_status = "unhealthy"
-        elif status_counts["warning"] > 0:
-            overall_status = "warning"
-        else:
-            overall_status = "healthy"
-        
-        # 生成报告
-        report = {
-            "overall_status": overall_status,
-            "timestamp": datetime.now().isoformat(),
-            "check_time_seconds": round(time.time() - start_time, 2),
-            "status_counts": status_counts,
-            "checks": checks
-        }
-        
-        return report
+        return self._build_report(checks, start_time, timestamp)
     
     def generate_summary(self, report: Dict[str, Any]) -> str:
         """
@@ -375,43 +481,37 @@ class LegacyHealthChecker:
         overall_status = report.get("overall_status", "unknown")
         status_counts = report.get("status_counts", {})
         check_time = report.get("check_time_seconds", 0)
+        status_emoji = _STATUS_EMOJI
+        
+        parts = [
+            "🔧 系统健康检查报告\n",
+            f"时间: {_iso_now().replace('T', ' ')}\n",
+            f"整体状态: {status_emoji.get(overall_status, '❓')} {overall_status}\n",
+            f"检查耗时: {check_time} 秒\n\n",
+            "组件状态:\n"
+        ]
         
-        # 状态表情符号映射
-        status_emoji = {
-            "healthy": "✅",
-            "warning": "⚠️",
-            "unhealthy": "❌",
-            "unknown": "❓"
-        }
-        
-        summary = f"🔧 系统健康检查报告\n"
-        summary += f"时间: {datetime.now().strftime('%Y-%m-%d %H:%M:%S')}\n"
-        summary += f"整体状态: {status_emoji.get(overall_status, '❓')} {overall_status}\n"
-        summary += f"检查耗时: {check_time} 秒\n\n"
-        
-        summary += "组件状态:\n"
+        # 组件状态和关键问题在同一次遍历中收集
+        # 只保留前MAX_SUMMARY_ISSUES个问题的文本，但统计全部问题数
+        issues = []
+        issue_count = 0
         for check_name, check_result in report.get("checks", {}).items():
             status = check_result.get("status", "unknown")
             component = check_result.get("component", check_name)
-            summary += f"{status_emoji.get(status, '❓')} {component}: {status}\n"
-        
-        # 添加关键问题
-        issues = []
-        for check_name, check_result in report.get("checks", {}).items():
-            if check_result.get("status") in ["unhealthy", "warning"]:
-                component = check_result.get("component", check_name)
-                details = check_result.get("details", {})
-                
-                if "error" in details:
-                    issues.append(f"• {component}: {details['error']}")
-                elif check_result.get("status") == "unhealthy":
-                    issues.append(f"• {component}: 状态异常")
+            parts.append(f"{status_emoji.get(status, '❓')} {component}: {status}\n")
+            
+            if status in _BAD_STATUSES:
+                error = check_result.get("details", {}).get("error")
+                if error is not None or status == "unhealthy":
+                    issue_count += 1
+                    if len(issues) < MAX_SUMMARY_ISSUES:
+                        issues.append(f"• {component}: {error if error is not None else '状态异常'}")
         
         if issues:
-            summary += f"\n⚠️ 发现问题 ({len(issues)} 个):\n"
-            summary += "\n".join(issues[:5])  # 只显示前5个问题
+            parts.append(f"\n⚠️ 发现问题 ({issue_count} 个):\n")
+            parts.append("\n".join(issues))
         
-        return summary
+        return "".join(parts)
     
     def send_health_report(self, report: Dict[str, Any]) -> bool:
         """
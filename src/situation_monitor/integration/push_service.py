@@ -7,17 +7,19 @@
 import sys
 import os
 import time
+import queue
+import threading
+from collections import Counter
+from dataclasses import dataclass, asdict
+from functools import lru_cache
 from datetime import datetime
-from typing import Dict, List, Any, Optional
+from typing import Dict, List, Any, Optional, Tuple
 
 # 添加父目录到路径
 sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.dirname(os.path.abspath(__file__)))))
 
-# 导入situation-monitor组件
-from situation_monitor.core.monitor import SituationMonitor, CheckStatus, AlertLevel
-from situation_monitor.checks.system_checks import create_default_checks
-from situation_monitor.alerts.integration import HealthCheckAlertAdapter, create_legacy_compatible_manager
-from situation_monitor.alerts.notifications import create_default_notifier
+# 导入situation-monitor核心组件（检查和告警模块在首次使用时导入）
+from situation_monitor.core.monitor import SituationMonitor, CheckStatus
 
 # 导入现有工具模块
 try:
@@ -30,14 +32,163 @@ except ImportError:
 
 # 强制使用situation-monitor检查，不使用旧的HealthChecker
 # 这样可以避免微信未配置警告干扰监控报告
-try:
-    from monitoring.health_check import HealthChecker
-    # 即使可以导入，也强制使用situation-monitor检查
-    HEALTH_CHECK_AVAILABLE = False
-    print("信息: HealthChecker模块可用，但强制使用situation-monitor检查")
-except ImportError:
-    HEALTH_CHECK_AVAILABLE = False
-    print("信息: HealthChecker模块不可用，使用situation-monitor检查")
+HEALTH_CHECK_AVAILABLE = False
+
+# 当前时间缓存的有效期（秒），同一监控周期内的多次取时复用同一个时间戳
+NOW_CACHE_SECONDS = 0.1
+
+# 健康检查报告的缓存时间（秒），短时间内连续的监控周期共享同一份报告
+REPORT_TTL_SECONDS = 1.0
+
+# Python 3.10+ 的dataclass支持slots参数
+_DATACLASS_OPTIONS = {"slots": True} if sys.version_info >= (3, 10) else {}
+
+# 平均检查时间的指数移动平均中新样本的权重
+CHECK_TIME_EMA_WEIGHT = 0.3
+
+# WhatsApp发送队列容量，队列满时丢弃新消息
+SEND_QUEUE_SIZE = 64
+
+# situation-monitor检查状态到报告状态的映射
+_STATUS_MAP = {
+    CheckStatus.HEALTHY: "healthy",
+    CheckStatus.WARNING: "warning",
+    CheckStatus.ERROR: "unhealthy",
+    CheckStatus.CRITICAL: "unhealthy",
+    CheckStatus.UNKNOWN: "unknown"
+}
+
+# 报告中固定统计的状态
+_STATUS_KEYS = ("healthy", "warning", "unhealthy", "unknown")
+
+# 监控消息中的表情符号（未列出的状态默认✅，未列出的告警级别默认ℹ️）
+_OVERALL_EMOJI = {"warning": "⚠️", "unhealthy": "❌", "unknown": "❓"}
+_CHECK_EMOJI = {"warning": "⚠️", "unhealthy": "❌"}
+_ALERT_EMOJI = {"warning": "⚠️", "error": "❌", "critical": "🔥"}
+
+# 监控消息模板
+_HEADER_TEMPLATE = "{emoji} 系统监控报告 {emoji}\n时间: {time}\n整体状态: {status}\n\n"
+_ALERT_LINE_TEMPLATE = "{emoji} {source}: {message}\n"
+_STATS_TEMPLATE = "\n📈 统计: 检查次数: {runs}, 平均耗时: {avg_check_time_ms:.1f}ms"
+
+# 监控消息中展示的系统资源指标及其显示名称（按显示顺序）
+_RESOURCE_LINES = {
+    "cpu_percent": "CPU",
+    "memory_percent": "内存",
+    "disk_percent": "磁盘"
+}
+
+# 微信未配置警告的特征文本（与小写化后的文本比较）
+_WECHAT_MARKERS = ("微信未配置", "微信推送未配置", "wechat")
+
+
+def _dig(data: Any, *keys: str, default: Any = "") -> Any:
+    """
+    按键路径逐层取值，路径不存在时返回默认值
+    
+    Args:
+        data: 嵌套字典
+        keys: 键路径
+        default: 默认值
+        
+    Returns:
+        取到的值或默认值
+    """
+    try:
+        for key in keys:
+            data = data[key]
+    except (KeyError, TypeError):
+        return default
+    return data
+
+
+def _is_wechat_not_configured(check_result: Dict[str, Any]) -> bool:
+    """
+    判断message_platforms检查结果是否只是微信未配置警告
+    
+    Args:
+        check_result: message_platforms检查结果
+        
+    Returns:
+        是否为微信未配置警告
+    """
+    if check_result.get("status", "unknown") != "warning":
+        return False
+    
+    details = check_result.get("details", {})
+    if not isinstance(details, dict):
+        return False
+    
+    # 方式1: 检查直接的消息字段
+    text = details.get("message", "").lower()
+    if any(marker in text for marker in _WECHAT_MARKERS):
+        return True
+    
+    # 方式2: 检查嵌套的wechat错误信息
+    text = _dig(details, "platforms", "wechat", "details", "error").lower()
+    return any(marker in text for marker in _WECHAT_MARKERS)
+
+
+@dataclass(**_DATACLASS_OPTIONS)
+class ServiceStats:
+    """推送服务统计"""
+    runs: int = 0
+    checks_performed: int = 0
+    alerts_generated: int = 0
+    notifications_sent: int = 0
+    last_run: Optional[str] = None
+    avg_check_time_ms: float = 0.0
+
+
+def _ema(prev: float, new: float, weight: float = CHECK_TIME_EMA_WEIGHT) -> float:
+    """指数移动平均：新样本权重为weight"""
+    return prev + weight * (new - prev)
+
+
+class SimpleLogger:
+    """简单的logger（utils.logger不可用时使用）"""
+    
+    def __init__(self, name):
+        self.name = name
+    
+    def info(self, msg):
+        print(f"[{self.name}] INFO: {msg}")
+    
+    def warning(self, msg):
+        print(f"[{self.name}] WARNING: {msg}")
+    
+    def error(self, msg):
+        print(f"[{self.name}] ERROR: {msg}")
+
+
+@lru_cache(maxsize=16)
+def _get_logger(name: str):
+    """获取指定名称的logger（同名logger在服务实例之间共享）"""
+    return Logger(name) if 'Logger' in sys.modules else SimpleLogger(name)
+
+
+# 告警组件在进程内只创建一次，所有服务实例共享。
+# 它们带有状态（活动告警、静音来源、通知冷却），共享后同一进程内的
+# 多个服务实例不会对同一问题重复告警或重复通知。
+@lru_cache(maxsize=1)
+def _alert_manager():
+    """获取共享的兼容告警管理器"""
+    from situation_monitor.alerts.integration import create_legacy_compatible_manager
+    return create_legacy_compatible_manager()
+
+
+@lru_cache(maxsize=1)
+def _alert_adapter():
+    """获取共享的健康检查告警适配器"""
+    from situation_monitor.alerts.integration import HealthCheckAlertAdapter
+    return HealthCheckAlertAdapter()
+
+
+@lru_cache(maxsize=1)
+def _notifier():
+    """获取共享的告警通知器"""
+    from situation_monitor.alerts.notifications import create_default_notifier
+    return create_default_notifier()
 
 
 class SituationMonitorPushService:
@@ -46,6 +197,12 @@ class SituationMonitorPushService:
     智能、高效、可扩展
     """
     
+    # process_health_alerts返回的告警数上限（统计中仍计入全部告警）
+    MAX_ALERT_PAYLOAD = 50
+    
+    # 监控消息中展示的告警数
+    MAX_MESSAGE_ALERTS = 3
+    
     def __init__(self, enable_whatsapp: bool = True):
         """
         初始化监控推送服务
@@ -56,7 +213,7 @@ class SituationMonitorPushService:
         self.enable_whatsapp = enable_whatsapp and WHATSAPP_AVAILABLE
         
         # 创建logger
-        self.logger = Logger(__name__) if 'Logger' in sys.modules else self._create_simple_logger()
+        self.logger = _get_logger(__name__)
         
         # 创建situation-monitor实例
         self.monitor = SituationMonitor("push_service_monitor")
@@ -64,44 +221,49 @@ class SituationMonitorPushService:
         # 添加默认检查
         self._setup_monitor_checks()
         
-        # 创建告警系统
-        self.alert_manager = create_legacy_compatible_manager()
-        self.health_adapter = HealthCheckAlertAdapter()
+        # 告警系统和通知器（进程内共享）
+        self.alert_manager = _alert_manager()
+        self.health_adapter = _alert_adapter()
+        self.notifier = _notifier()
+        
+        # 最近一次取时：(monotonic时间, datetime, ISO字符串)
+        self._now_cached: Tuple[float, Optional[datetime], str] = (float("-inf"), None, "")
+        
+        # 最近一次生成的监控消息正文：(消息指纹, 正文)
+        self._message_cache: Optional[Tuple[tuple, str]] = None
         
-        # 创建通知器
-        self.notifier = create_default_notifier()
+        # 健康检查报告缓存：(monotonic时间, quick_mode, 报告)
+        self._report_cache: Optional[Tuple[float, bool, Dict[str, Any]]] = None
+        
+        # WhatsApp消息由后台线程发送，不阻塞监控周期
+        self._stats_lock = threading.Lock()
+        self._send_queue: "queue.Queue[str]" = queue.Queue(maxsize=SEND_QUEUE_SIZE)
+        if self.enable_whatsapp:
+            threading.Thread(target=self._send_worker, name="whatsapp-sender", daemon=True).start()
         
         # 服务统计
-        self.stats = {
-            "runs": 0,
-            "checks_performed": 0,
-            "alerts_generated": 0,
-            "notifications_sent": 0,
-            "last_run": None,
-            "avg_check_time_ms": 0
-        }
+        self.stats = ServiceStats()
         
         self.logger.info("SituationMonitorPushService初始化完成")
     
-    def _create_simple_logger(self):
-        """创建简单的logger"""
-        class SimpleLogger:
-            def __init__(self, name):
-                self.name = name
-            
-            def info(self, msg):
-                print(f"[{self.name}] INFO: {msg}")
-            
-            def warning(self, msg):
-                print(f"[{self.name}] WARNING: {msg}")
-            
-            def error(self, msg):
-                print(f"[{self.name}] ERROR: {msg}")
+    def _now_iso(self) -> Tuple[datetime, str]:
+        """
+        获取当前时间及其ISO格式字符串（NOW_CACHE_SECONDS内复用）
         
-        return SimpleLogger(__name__)
+        Returns:
+            (当前时间, ISO格式字符串)
+        """
+        mono = time.monotonic()
+        cached = self._now_cached
+        if mono - cached[0] >= NOW_CACHE_SECONDS:
+            now = datetime.now()
+            cached = self._now_cached = (mono, now, now.isoformat())
+        return cached[1], cached[2]
     
     def _setup_monitor_checks(self):
         """设置监控检查"""
+        from situation_monitor.checks.system_checks import create_default_checks
+        
         checks = create_default_checks()
         
         for check in checks:
@@ -109,21 +271,35 @@ class SituationMonitorPushService:
         
         self.logger.info(f"添加了 {len(checks)} 个监控检查")
     
-    def run_health_check(self, quick_mode: bool = True) -> Dict[str, Any]:
+    def run_health_check(self, quick_mode: bool = True, force_refresh: bool = False) -> Dict[str, Any]:
         """
-        运行健康检查
+        运行健康检查（REPORT_TTL_SECONDS内的重复调用返回缓存的报告）
         
         Args:
             quick_mode: 是否使用快速检查模式
+            force_refresh: 是否忽略缓存重新检查
             
         Returns:
             健康检查报告
         """
+        cached = self._report_cache
+        if (not force_refresh and cached is not None and cached[1] == quick_mode
+                and time.monotonic() - cached[0] < REPORT_TTL_SECONDS):
+            return cached[2]
+        
+        report = self._run_health_check(quick_mode)
+        if "error" not in report:
+            self._report_cache = (time.monotonic(), quick_mode, report)
+        return report
+    
+    def _run_health_check(self, quick_mode: bool) -> Dict[str, Any]:
+        """运行健康检查（不使用缓存）"""
         if not HEALTH_CHECK_AVAILABLE:
             # 使用situation-monitor的检查
             return self._run_situation_monitor_checks()
         
         try:
+            from monitoring.health_check import HealthChecker
             health_checker = HealthChecker()
             
             if quick_mode:
@@ -138,7 +314,7 @@ class SituationMonitorPushService:
             return {
                 "overall_status": "unknown",
                 "error": str(e),
-                "timestamp": datetime.now().isoformat()
+                "timestamp": self._now_iso()[1]
             }
     
     def _run_situation_monitor_checks(self) -> Dict[str, Any]:
@@ -146,22 +322,9 @@ class SituationMonitorPushService:
         results = self.monitor.run_all_checks()
         
         checks = {}
-        status_counts = {"healthy": 0, "warning": 0, "unhealthy": 0, "unknown": 0}
-        
         for check_id, result in results.items():
             if result:
-                # 转换状态
-                status_map = {
-                    CheckStatus.HEALTHY: "healthy",
-                    CheckStatus.WARNING: "warning",
-                    CheckStatus.ERROR: "unhealthy",
-                    CheckStatus.CRITICAL: "unhealthy",
-                    CheckStatus.UNKNOWN: "unknown"
-                }
-                
-                status = status_map.get(result.status, "unknown")
-                status_counts[status] = status_counts.get(status, 0) + 1
-                
+                status = _STATUS_MAP.get(result.status, "unknown")
                 checks[check_id] = {
                     "component": result.check_name,
                     "status": status,
@@ -172,17 +335,15 @@ class SituationMonitorPushService:
                     }
                 }
         
+        counts = Counter(check["status"] for check in checks.values())
+        status_counts = {key: counts[key] for key in _STATUS_KEYS}
+        
         # 确定整体状态
-        if status_counts["unhealthy"] > 0:
-            overall_status = "unhealthy"
-        elif status_counts["warning"] > 0:
-            overall_status = "warning"
-        else:
-            overall_status = "healthy"
+        overall_status = "unhealthy" if counts["unhealthy"] else "warning" if counts["warning"] else "healthy"
         
         return {
             "overall_status": overall_status,
-            "timestamp": datetime.now().isoformat(),
+            "timestamp": self._now_iso()[1],
             "status_counts": status_counts,
             "checks": checks
         }
@@ -195,38 +356,43 @@ class SituationMonitorPushService:
             report: 健康检查报告
             
         Returns:
-            生成的告警列表
+            生成的告警列表（最多MAX_ALERT_PAYLOAD个）
         """
         # 使用适配器处理健康检查报告
         alerts = self.health_adapter.process_quick_health_check(report)
         
-        # 转换为字典格式
-        alert_dicts = []
-        for alert in alerts:
-            alert_dicts.append({
+        # 转换为字典格式（只转换需要返回的部分）
+        alert_dicts = [
+            {
                 "alert_id": alert.alert_id,
                 "level": alert.level.value,
                 "title": alert.title,
                 "source": alert.source,
                 "message": alert.message[:100]
-            })
+            }
+            for alert in alerts[:self.MAX_ALERT_PAYLOAD]
+        ]
         
-        self.stats["alerts_generated"] += len(alerts)
+        with self._stats_lock:
+            self.stats.alerts_generated += len(alerts)
         return alert_dicts
     
-    def generate_monitoring_message(self, report: Dict[str, Any], alerts: List[Dict[str, Any]]) -> str:
+    def generate_monitoring_message(self, report: Dict[str, Any], alerts: List[Dict[str, Any]],
+                                    now: Optional[datetime] = None) -> str:
         """
         生成监控消息
         
         Args:
             report: 健康检查报告
             alerts: 告警列表
+            now: 报告时间（默认为当前时间）
             
         Returns:
             监控消息文本
         """
-        current_time = datetime.now()
-        time_str = current_time.strftime("%Y-%m-%d %H:%M:%S")
+        if now is None:
+            now = self._now_iso()[0]
+        time_str = now.strftime("%Y-%m-%d %H:%M:%S")
         
         # 确定整体状态表情
         overall_status = report.get("overall_status", "unknown")
@@ -238,130 +404,157 @@ class SituationMonitorPushService:
             status_emoji = "✅"
         else:
             display_status = overall_status
-            status_emoji = "✅"
-            if overall_status == "warning":
-                status_emoji = "⚠️"
-            elif overall_status == "unhealthy":
-                status_emoji = "❌"
-            elif overall_status == "unknown":
-                status_emoji = "❓"
-        
-        # 构建消息
-        message = f"{status_emoji} 系统监控报告 {status_emoji}\n"
-        message += f"时间: {time_str}\n"
-        message += f"整体状态: {display_status}\n\n"
+            status_emoji = _OVERALL_EMOJI.get(overall_status, "✅")
         
-        # 添加检查摘要
         checks = report.get("checks", {})
         
-        # 过滤掉message_platforms检查（如果它是微信未配置警告）
-        filtered_checks = {}
-        for check_id, check_result in checks.items():
-            if check_id == "message_platforms":
-                status = check_result.get("status", "unknown")
-                if status == "warning":
-                    details = check_result.get("details", {})
-                    # 检查是否是微信未配置警告
-                    is_wechat_warning = False
-                    
-                    # 方式1: 检查直接的消息字段
-                    message_text = details.get("message", "")
-                    if "微信未配置" in message_text or "wechat" in message_text.lower():
-                        is_wechat_warning = True
-                    
-                    # 方式2: 检查嵌套的wechat错误信息
-                    if not is_wechat_warning and isinstance(details, dict):
-                        platforms = details.get("platforms", {})
-                        wechat_info = platforms.get("wechat", {})
-                        wechat_details = wechat_info.get("details", {})
-                        wechat_error = wechat_details.get("error", "")
-                        
-                        if "微信推送未配置" in wechat_error or "wechat" in wechat_error.lower():
-                            is_wechat_warning = True
-                    
-                    # 如果是微信未配置警告，跳过此检查
-                    if is_wechat_warning:
-                        continue
-            
-            filtered_checks[check_id] = check_result
-        
-        if filtered_checks:
-            message += "📊 组件状态:\n"
-            
-            for check_id, check_result in filtered_checks.items():
-                status = check_result.get("status", "unknown")
-                component = check_result.get("component", check_id)
-                
-                check_emoji = "✅"
-                if status == "warning":
-                    check_emoji = "⚠️"
-                elif status == "unhealthy":
-                    check_emoji = "❌"
-                
-                message += f"{check_emoji} {component}: {status}\n"
+        # 要显示的(组件, 状态)，跳过message_platforms的微信未配置警告；
+        # 直接生成元组作为指纹的一部分，不再复制检查字典
+        check_lines = tuple(
+            (check_result.get("component", check_id), check_result.get("status", "unknown"))
+            for check_id, check_result in checks.items()
+            if not (check_id == "message_platforms" and _is_wechat_not_configured(check_result))
+        )
+        
+        resources = checks.get("system_resources", {}).get("details", {}).get("metrics", {})
+        shown_resources = tuple((key, resources[key]) for key in _RESOURCE_LINES if key in resources)
+        
+        # 消息正文只取决于以下内容；与上次相同时直接复用上次的正文，只重新生成时间和统计
+        fingerprint = (
+            check_lines,
+            len(alerts),
+            tuple(
+                (alert.get("level", "unknown"), alert.get("source", "unknown"), alert.get("message", ""))
+                for alert in alerts[:self.MAX_MESSAGE_ALERTS]
+            ),
+            bool(resources),
+            shown_resources
+        )
+        cached = self._message_cache
+        if cached is not None and cached[0] == fingerprint:
+            body = cached[1]
+        else:
+            body = self._build_message_body(fingerprint)
+            self._message_cache = (fingerprint, body)
+        
+        return "".join((
+            _HEADER_TEMPLATE.format(emoji=status_emoji, time=time_str, status=display_status),
+            body,
+            _STATS_TEMPLATE.format(runs=self.stats.runs, avg_check_time_ms=self.stats.avg_check_time_ms)
+        ))
+    
+    def _build_message_body(self, fingerprint: tuple) -> str:
+        """
+        生成监控消息正文（组件状态、告警和系统资源）
+        
+        Args:
+            fingerprint: generate_monitoring_message计算的消息指纹
+            
+        Returns:
+            消息正文
+        """
+        check_lines, alert_count, shown_alerts, has_resources, shown_resources = fingerprint
+        
+        # 各段收集到列表中，最后一次拼接
+        parts = []
+        
+        # 添加检查摘要
+        if check_lines:
+            parts.append("📊 组件状态:\n")
+            
+            for component, status in check_lines:
+                parts.append(f"{_CHECK_EMOJI.get(status, '✅')} {component}: {status}\n")
         else:
-            message += "📊 检查详情: 无检查结果\n"
+            parts.append("📊 检查详情: 无检查结果\n")
         
         # 添加告警信息
-        if alerts:
-            message += f"\n🚨 活动告警 ({len(alerts)}个):\n"
-            
-            for i, alert in enumerate(alerts[:3]):  # 只显示前3个
-                level = alert.get("level", "unknown")
-                source = alert.get("source", "unknown")
-                alert_message = alert.get("message", "")
-                
-                alert_emoji = "ℹ️"
-                if level == "warning":
-                    alert_emoji = "⚠️"
-                elif level == "error":
-                    alert_emoji = "❌"
-                elif level == "critical":
-                    alert_emoji = "🔥"
-                
-                message += f"{alert_emoji} {source}: {alert_message}\n"
-            
-            if len(alerts) > 3:
-                message += f"  还有 {len(alerts) - 3} 个告警...\n"
+        if alert_count:
+            parts.append(f"\n🚨 活动告警 ({alert_count}个):\n")
+            
+            for level, source, message in shown_alerts:
+                parts.append(_ALERT_LINE_TEMPLATE.format(
+                    emoji=_ALERT_EMOJI.get(level, "ℹ️"),
+                    source=source,
+                    message=message
+                ))
+            
+            if alert_count > self.MAX_MESSAGE_ALERTS:
+                parts.append(f"  还有 {alert_count - self.MAX_MESSAGE_ALERTS} 个告警...\n")
         else:
-            message += "\n✅ 无活动告警\n"
+            parts.append("\n✅ 无活动告警\n")
         
         # 添加系统资源信息
-        if "system_resources" in checks:
-            resources = checks["system_resources"].get("details", {}).get("metrics", {})
-            if resources:
-                message += "\n💻 系统资源:\n"
-                
-                if "cpu_percent" in resources:
-                    message += f"  CPU: {resources['cpu_percent']}%\n"
-                
-                if "memory_percent" in resources:
-                    message += f"  内存: {resources['memory_percent']}%\n"
-                
-                if "disk_percent" in resources:
-                    message += f"  磁盘: {resources['disk_percent']}%\n"
-        
-        # 添加统计信息
-        message += f"\n📈 统计: "
-        message += f"检查次数: {self.stats['runs']}, "
-        message += f"平均耗时: {self.stats['avg_check_time_ms']:.1f}ms"
-        
-        return message
+        if has_resources:
+            parts.append("\n💻 系统资源:\n")
+            for key, value in shown_resources:
+                parts.append(f"  {_RESOURCE_LINES[key]}: {value}%\n")
+        
+        return "".join(parts)
     
     def send_whatsapp_notification(self, message: str) -> bool:
         """
-        发送WhatsApp通知
+        发送WhatsApp通知（加入发送队列后立即返回，由后台线程发送）
         
         Args:
             message: 消息内容
             
         Returns:
-            是否成功发送
+            是否成功加入发送队列
         """
         if not self.enable_whatsapp:
             self.logger.warning("WhatsApp推送已禁用")
             return False
         
+        try:
+            self._send_queue.put_nowait(message)
+        except queue.Full:
+            self.logger.warning("WhatsApp发送队列已满，丢弃本条消息")
+            return False
+        
+        return True
+    
+    def flush(self, timeout: Optional[float] = None) -> bool:
+        """
+        等待发送队列中的消息全部发送完成
+        
+        Args:
+            timeout: 最长等待时间（秒），None表示一直等待
+            
+        Returns:
+            队列是否已清空
+        """
+        send_queue = self._send_queue
+        deadline = None if timeout is None else time.monotonic() + timeout
+        with send_queue.all_tasks_done:
+            while send_queue.unfinished_tasks:
+                if deadline is None:
+                    send_queue.all_tasks_done.wait()
+                    continue
+                remaining = deadline - time.monotonic()
+                if remaining <= 0:
+                    return False
+                send_queue.all_tasks_done.wait(remaining)
+        return True
+    
+    def _send_worker(self):
+        """后台发送线程：依次发送队列中的消息"""
+        while True:
+            message = self._send_queue.get()
+            try:
+                self._deliver_whatsapp(message)
+            finally:
+                self._send_queue.task_done()
+    
+    def _deliver_whatsapp(self, message: str) -> bool:
+        """
+        同步发送一条WhatsApp消息
+        
+        Args:
+            message: 消息内容
+            
+        Returns:
+            是否成功发送
+        """
         try:
             result = send_whatsapp_message(message)
             
@@ -375,7 +568,8 @@ class SituationMonitorPushService:
                 success = bool(result)
             
             if success:
-                self.stats["notifications_sent"] += 1
+                with self._stats_lock:
+                    self.stats.notifications_sent += 1
                 self.logger.info("WhatsApp监控消息发送成功")
             else:
                 self.logger.warning("WhatsApp监控消息发送失败")
@@ -396,10 +590,11 @@ class SituationMonitorPushService:
         Returns:
             推送结果（兼容现有格式）
         """
-        start_time = time.time()
+        start_time = time.perf_counter()
+        now, now_iso = self._now_iso()
         
         result = {
-            'timestamp': datetime.now().isoformat(),
+            'timestamp': now_iso,
             'checked': False,
             'pushed': False,
             'push_type': None,
@@ -416,33 +611,19 @@ class SituationMonitorPushService:
             # 2. 处理告警
             alerts = self.process_health_alerts(health_report)
             
-            # 3. 生成监控消息
-            message = self.generate_monitoring_message(health_report, alerts)
-            
-            # 4. 确定推送类型
+            # 3. 确定推送类型
             overall_status = health_report.get('overall_status', 'unknown')
             push_type = self._determine_push_type(overall_status, force_push)
             
-            # 5. 发送通知
+            # 4. 需要推送时才生成监控消息并发送通知
             notification_sent = False
             if push_type != 'none':
+                message = self.generate_monitoring_message(health_report, alerts, now)
                 notification_sent = self.send_whatsapp_notification(message)
             
             # 更新统计
-            duration_ms = (time.time() - start_time) * 1000
-            self.stats["runs"] += 1
-            self.stats["checks_performed"] += len(health_report.get("checks", {}))
-            
-            # 更新平均检查时间
-            if self.stats["runs"] == 1:
-                self.stats["avg_check_time_ms"] = duration_ms
-            else:
-                # 指数移动平均
-                self.stats["avg_check_time_ms"] = (
-                    0.7 * self.stats["avg_check_time_ms"] + 0.3 * duration_ms
-                )
-            
-            self.stats["last_run"] = datetime.now().isoformat()
+            duration_ms = (time.perf_counter() - start_time) * 1000
+            self._record_duration_ms(duration_ms, len(health_report.get("checks", {})))
             
             # 填充结果
             result['checked'] = True
@@ -464,6 +645,27 @@ class SituationMonitorPushService:
             self.logger.error(f"检查并推送时出错: {e}")
             return result
     
+    def _record_duration_ms(self, duration_ms: float, checks_performed: int):
+        """
+        记录一次监控周期的统计信息
+        
+        Args:
+            duration_ms: 本次周期耗时（毫秒）
+            checks_performed: 本次执行的检查数
+        """
+        stats = self.stats
+        with self._stats_lock:
+            stats.runs += 1
+            stats.checks_performed += checks_performed
+            
+            # 平均检查时间：首次直接取值，之后使用指数移动平均
+            if stats.runs == 1:
+                stats.avg_check_time_ms = duration_ms
+            else:
+                stats.avg_check_time_ms = _ema(stats.avg_check_time_ms, duration_ms)
+            
+            stats.last_run = self._now_iso()[1]
+    
     def _determine_push_type(self, overall_status: str, force_push: bool) -> str:
         """
         确定推送类型
@@ -497,7 +699,8 @@ class SituationMonitorPushService:
         Returns:
             监控结果
         """
-        start_time = time.time()
+        start_time = time.perf_counter()
+        now = self._now_iso()[0]
         
         try:
             # 1. 运行健康检查
@@ -507,7 +710,7 @@ class SituationMonitorPushService:
             alerts = self.process_health_alerts(health_report)
             
             # 3. 生成监控消息
-            message = self.generate_monitoring_message(health_report, alerts)
+            message = self.generate_monitoring_message(health_report, alerts, now)
             
             # 4. 发送通知（如果启用）
             notification_sent = False
@@ -515,20 +718,8 @@ class SituationMonitorPushService:
                 notification_sent = self.send_whatsapp_notification(message)
             
             # 更新统计
-            duration_ms = (time.time() - start_time) * 1000
-            self.stats["runs"] += 1
-            self.stats["checks_performed"] += len(health_report.get("checks", {}))
-            
-            # 更新平均检查时间
-            if self.stats["runs"] == 1:
-                self.stats["avg_check_time_ms"] = duration_ms
-            else:
-                # 指数移动平均
-                self.stats["avg_check_time_ms"] = (
-                    0.7 * self.stats["avg_check_time_ms"] + 0.3 * duration_ms
-                )
-            
-            self.stats["last_run"] = datetime.now().isoformat()
+            duration_ms = (time.perf_counter() - start_time) * 1000
+            self._record_duration_ms(duration_ms, len(health_report.get("checks", {})))
             
             result = {
                 "success": True,
@@ -547,13 +738,13 @@ class SituationMonitorPushService:
             
             # 发送错误通知
             if send_notification and self.enable_whatsapp:
-                error_message = f"❌ 监控系统错误\n时间: {datetime.now().strftime('%H:%M:%S')}\n错误: {str(e)[:100]}"
+                error_message = f"❌ 监控系统错误\n时间: {self._now_iso()[0].strftime('%H:%M:%S')}\n错误: {str(e)[:100]}"
                 self.send_whatsapp_notification(error_message)
             
             return {
                 "success": False,
                 "error": str(e),
-                "duration_ms": (time.time() - start_time) * 1000
+                "duration_ms": (time.perf_counter() - start_time) * 1000
             }
     
     def get_service_status(self) -> Dict[str, Any]:
@@ -564,12 +755,12 @@ class SituationMonitorPushService:
             服务状态信息
         """
         return {
-            **self.stats,
+            **asdict(self.stats),
             "whatsapp_enabled": self.enable_whatsapp,
             "health_check_available": HEALTH_CHECK_AVAILABLE,
             "monitor_check_count": len(self.monitor.checks),
             "alert_manager_alerts": len(self.alert_manager.get_active_alerts()),
-            "current_time": datetime.now().isoformat()
+            "current_time": self._now_iso()[1]
         }
 
 
@@ -586,11 +777,15 @@ def run_situation_monitor_push_service():
         print("运行监控周期...")
         result = service.run_monitoring_cycle(send_notification=True)
         
+        # 等待后台线程发送完通知后再退出
+        if not service.flush(timeout=60):
+            print("⚠️ 等待WhatsApp消息发送超时")
+        
         if result["success"]:
             print(f"✅ 监控周期成功完成")
             print(f"   耗时: {result['duration_ms']:.1f}ms")
             print(f"   告警生成: {result['alerts_generated']}个")
-            print(f"   通知发送: {'成功' if result['notification_sent'] else '失败'}")
+            print(f"   通知发送: {'已提交' if result['notification_sent'] else '失败'}")
             
             # 显示消息预览
             if "message_preview" in result:
@@ -7,44 +7,170 @@
 import sys
 import os
 import time
+import weakref
 from datetime import datetime
 from typing import Dict, List, Any, Optional, Tuple
 import json
 
+# orjson为可选依赖，可用时加速运行日志的序列化
+try:
+    import orjson
+    ORJSON_AVAILABLE = True
+except ImportError:
+    ORJSON_AVAILABLE = False
+
 # 添加父目录到路径
 sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.dirname(os.path.abspath(__file__)))))
 
-# 导入situation-monitor组件
-try:
-    from core.monitor import SituationMonitor, CheckStatus, AlertLevel
-    from checks.system_checks import create_default_checks
-    from alerts.integration import HealthCheckAlertAdapter, create_legacy_compatible_manager
-    from alerts.notifications import create_default_notifier
+# src目录也加入路径，以便在加载situation-monitor组件之前导入utils等现有模块
+_SRC_DIR = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+if _SRC_DIR not in sys.path:
+    sys.path.insert(0, _SRC_DIR)
+
+# situation-monitor组件和推送模块在首次使用时导入（见_import_situation_monitor/_import_push_modules），
+# 只查看统计等不需要这些模块的调用不承担导入开销。None表示尚未尝试导入
+SITUATION_MONITOR_AVAILABLE: Optional[bool] = None
+PUSH_MODULES_AVAILABLE: Optional[bool] = None
+
+
+def _import_situation_monitor() -> bool:
+    """
+    导入situation-monitor组件（只在首次调用时导入）
+    
+    Returns:
+        situation-monitor是否可用
+    """
+    global SITUATION_MONITOR_AVAILABLE
+    if SITUATION_MONITOR_AVAILABLE is not None:
+        return SITUATION_MONITOR_AVAILABLE
+    
+    try:
+        from core import monitor
+        from checks import system_checks
+        from alerts import integration
+    except ImportError:
+        # 如果相对导入失败，尝试绝对导入
+        try:
+            from src.situation_monitor.core import monitor
+            from src.situation_monitor.checks import system_checks
+            from src.situation_monitor.alerts import integration
+        except ImportError as e:
+            print(f"警告: 无法导入situation-monitor组件: {e}")
+            SITUATION_MONITOR_AVAILABLE = False
+            return False
+    
+    globals().update(
+        SituationMonitor=monitor.SituationMonitor,
+        CheckStatus=monitor.CheckStatus,
+        create_default_checks=system_checks.create_default_checks,
+        create_legacy_compatible_manager=integration.create_legacy_compatible_manager
+    )
     SITUATION_MONITOR_AVAILABLE = True
-except ImportError:
-    # 如果相对导入失败，尝试绝对导入
+    return True
+
+
+def _import_push_modules() -> bool:
+    """
+    导入现有推送模块（只在首次调用时导入）
+    
+    Returns:
+        推送模块是否可用
+    """
+    global PUSH_MODULES_AVAILABLE
+    if PUSH_MODULES_AVAILABLE is not None:
+        return PUSH_MODULES_AVAILABLE
+    
     try:
-        from src.situation_monitor.core.monitor import SituationMonitor, CheckStatus, AlertLevel
-        from src.situation_monitor.checks.system_checks import create_default_checks
-        from src.situation_monitor.alerts.integration import HealthCheckAlertAdapter, create_legacy_compatible_manager
-        from src.situation_monitor.alerts.notifications import create_default_notifier
-        SITUATION_MONITOR_AVAILABLE = True
+        from src.common.news_stock_pusher_optimized import NewsStockPusherOptimized
+        from src.stocks.multi_stock_monitor import MultiStockMonitor
     except ImportError as e:
-        print(f"警告: 无法导入situation-monitor组件: {e}")
-        SITUATION_MONITOR_AVAILABLE = False
-
-# 导入现有推送模块
-try:
-    from src.common.news_stock_pusher_optimized import NewsStockPusherOptimized
-    from src.stocks.multi_stock_monitor import MultiStockMonitor
-    from src.monitoring.health_check import HealthChecker
-    from utils.config import ConfigManager
-    from utils.logger import Logger
-    from utils.message_sender import send_whatsapp_message
+        print(f"警告: 导入推送模块失败: {e}")
+        PUSH_MODULES_AVAILABLE = False
+        return False
+    
+    globals().update(
+        NewsStockPusherOptimized=NewsStockPusherOptimized,
+        MultiStockMonitor=MultiStockMonitor
+    )
     PUSH_MODULES_AVAILABLE = True
-except ImportError as e:
-    print(f"警告: 导入推送模块失败: {e}")
-    PUSH_MODULES_AVAILABLE = False
+    return True
+
+# 健康检查报告的缓存时间（秒），缓存期内的重复检查直接返回上次的报告
+HEALTH_CACHE_TTL_SECONDS = 60
+
+# 新闻重要性对应的表情符号（未列出的为⚪）
+_IMPORTANCE_EMOJI = {
+    "high": "🔴",
+    "medium": "🟡",
+    "low": "🟢"
+}
+
+# 推送消息中的分隔线
+_SEP = "-" * 30
+
+# 股票涨跌表情符号，以"涨跌 >= 0"为下标
+_CHANGE_EMOJI = ("📉", "📈")
+
+# 运行日志（每次运行一行JSON，追加写入同一文件）
+RUN_LOG_PATH = "./logs/new_push_system.jsonl"
+
+# 运行日志缓冲的记录数达到该值时写入文件（进程退出时也会写入）
+RUN_LOG_FLUSH_THRESHOLD = 16
+
+
+# 推送时段配置项及其默认值（小时）
+_PUSH_HOUR_DEFAULTS = (
+    ("STOCK_PUSH_START", 8),
+    ("STOCK_PUSH_END", 18),
+    ("NEWS_PUSH_START", 8),
+    ("NEWS_PUSH_END", 22)
+)
+
+
+def _normalize_push_hours(config: Dict[str, Any]) -> Dict[str, Any]:
+    """
+    将配置中的推送时段统一转换为整数小时
+    配置值可能带有注释（如"8 # 开始时间"），取第一个单词；无法解析时使用默认值
+    
+    Args:
+        config: 原始配置字典
+        
+    Returns:
+        推送时段为整数的配置字典（副本）
+    """
+    config = dict(config)
+    for key, default in _PUSH_HOUR_DEFAULTS:
+        try:
+            config[key] = int(str(config.get(key, default)).split()[0])
+        except (ValueError, IndexError):
+            config[key] = default
+    return config
+
+
+def _push_hour_mask(start: int, end: int) -> int:
+    """将推送时段[start, end)转换为小时位掩码（第h位为1表示h点在时段内）"""
+    return sum(1 << hour for hour in range(max(start, 0), min(end, 24)))
+
+
+def _append_run_log(path: str, buffer: List[bytes], logger) -> None:
+    """
+    将缓冲的运行日志追加写入文件并清空缓冲
+    供flush_run_logs和实例的终结器（回收或进程退出时）共用，因此不引用实例本身
+    """
+    if not buffer:
+        return
+    
+    lines = buffer[:]
+    del buffer[:]
+    try:
+        os.makedirs(os.path.dirname(path), exist_ok=True)
+        with open(path, 'ab') as f:
+            f.write(b"\n".join(lines) + b"\n")
+        
+        logger.info(f"运行日志已保存: {path} ({len(lines)} 条)")
+    except Exception as e:
+        logger.error(f"保存运行日志失败: {e}")
+
 
 class NewPushSystem:
     """
@@ -52,10 +178,17 @@ class NewPushSystem:
     基于situation-monitor架构，集成新闻推送和股票监控
     """
     
-    def __init__(self, enable_whatsapp: bool = True):
-        """初始化新版推送系统"""
+    def __init__(self, enable_whatsapp: bool = True, load_components: bool = True):
+        """
+        初始化新版推送系统
+        
+        Args:
+            enable_whatsapp: 是否启用WhatsApp推送
+            load_components: 是否加载监控和推送组件（只查看统计时可以跳过）
+        """
         self.enable_whatsapp = enable_whatsapp
         self.start_time = time.time()
+        self._start_monotonic = time.monotonic()  # 用于计算运行时长，不受系统时钟调整影响
         
         # 创建logger
         self.logger = self._create_logger()
@@ -63,21 +196,37 @@ class NewPushSystem:
         # 初始化配置
         self.config = self._load_config()
         
+        # 推送时段在初始化时解析为小时位掩码
+        self._stock_mask = _push_hour_mask(self.config["STOCK_PUSH_START"], self.config["STOCK_PUSH_END"])
+        self._news_mask = _push_hour_mask(self.config["NEWS_PUSH_START"], self.config["NEWS_PUSH_END"])
+        
         # 初始化situation-monitor
-        if SITUATION_MONITOR_AVAILABLE:
-            self.monitor = SituationMonitor("new_push_system")
-            self._setup_monitor_checks()
-        else:
-            self.monitor = None
-            self.logger.warning("situation-monitor不可用，使用简化模式")
+        self.monitor = None
+        self.alert_manager = None
+        if load_components:
+            if _import_situation_monitor():
+                self.monitor = SituationMonitor("new_push_system")
+                self._setup_monitor_checks()
+                
+                # 初始化告警系统
+                self.alert_manager = create_legacy_compatible_manager()
+            else:
+                self.logger.warning("situation-monitor不可用，使用简化模式")
         
-        # 初始化告警系统
-        self.alert_manager = create_legacy_compatible_manager()
+        # 运行日志缓冲，实例被回收或进程退出时写入剩余记录（终结器不会让实例一直存活）
+        self._log_buffer: List[bytes] = []
+        self._log_path = RUN_LOG_PATH
+        weakref.finalize(self, _append_run_log, self._log_path, self._log_buffer, self.logger)
+        
+        # 健康检查报告缓存：(monotonic时间, 报告)
+        self._health_cache: Optional[Tuple[float, Dict[str, Any]]] = None
+        self._health_ttl = HEALTH_CACHE_TTL_SECONDS
         
         # 初始化推送组件
         self.news_pusher = None
         self.stock_monitor = None
-        self._init_push_components()
+        if load_components:
+            self._init_push_components()
         
         # 统计信息
         self.stats = {
@@ -114,7 +263,11 @@ class NewPushSystem:
             return SimpleLogger("NewPushSystem")
     
     def _load_config(self):
-        """加载配置"""
+        """加载配置（推送时段统一转换为整数小时）"""
+        return _normalize_push_hours(self._load_raw_config())
+    
+    def _load_raw_config(self):
+        """加载原始配置"""
         try:
             from utils.config import ConfigManager
             config_mgr = ConfigManager()
@@ -146,7 +299,7 @@ class NewPushSystem:
     
     def _init_push_components(self):
         """初始化推送组件"""
-        if not PUSH_MODULES_AVAILABLE:
+        if not _import_push_modules():
             self.logger.warning("推送模块不可用，使用模拟模式")
             return
         
@@ -157,8 +310,23 @@ class NewPushSystem:
         except Exception as e:
             self.logger.error(f"初始化推送组件失败: {e}")
     
-    def check_system_health(self) -> Dict[str, Any]:
-        """检查系统健康状态"""
+    def check_system_health(self, force_refresh: bool = False) -> Dict[str, Any]:
+        """
+        检查系统健康状态（缓存时间内的重复调用返回上次的报告）
+        
+        Args:
+            force_refresh: 是否忽略缓存重新检查
+        """
+        cached = self._health_cache
+        if not force_refresh and cached is not None and time.monotonic() - cached[0] < self._health_ttl:
+            return cached[1]
+        
+        health_report = self._run_health_checks()
+        self._health_cache = (time.monotonic(), health_report)
+        return health_report
+    
+    def _run_health_checks(self) -> Dict[str, Any]:
+        """运行健康检查并生成报告（不使用缓存）"""
         self.logger.info("开始系统健康检查...")
         
         if not self.monitor:
@@ -193,10 +361,20 @@ class NewPushSystem:
         elif any(r.status == CheckStatus.WARNING for r in monitor_results.values()):
             overall_status = "warning"
         
+        # 转换检查结果格式（run_all_checks返回的都是CheckResult，字段总是存在）
         health_report = {
             "timestamp": datetime.now().isoformat(),
             "overall_status": overall_status,
-            "checks": {},
+            "checks": {
+                name: {
+                    "status": result.status.value,
+                    "message": result.message,
+                    "metrics": result.metrics,
+                    "duration_ms": result.duration_ms,
+                    "check_name": result.check_name
+                }
+                for name, result in monitor_results.items()
+            },
             "details": {
                 "push_system": "new_situation_monitor",
                 "version": "v0.2.1",
@@ -204,52 +382,20 @@ class NewPushSystem:
             }
         }
         
-        # 转换检查结果格式
-        for name, result in monitor_results.items():
-            health_report["checks"][name] = {
-                "status": result.status.value,
-                "message": result.message,
-                "metrics": result.metrics if hasattr(result, 'metrics') else {},
-                "duration_ms": result.duration_ms if hasattr(result, 'duration_ms') else 0,
-                "check_name": result.check_name if hasattr(result, 'check_name') else name
-            }
-        
         self.logger.info(f"系统健康检查完成: {overall_status}")
         return health_report
     
-    def should_push_stocks(self) -> bool:
-        """是否应该推送股票"""
-        current_hour = datetime.now().hour
-        
-        # 从配置值中提取数字（处理可能包含注释的情况）
-        stock_start_str = str(self.config.get("STOCK_PUSH_START", "8")).split()[0]  # 取第一个单词
-        stock_end_str = str(self.config.get("STOCK_PUSH_END", "18")).split()[0]
-        
-        try:
-            stock_start = int(stock_start_str)
-            stock_end = int(stock_end_str)
-        except ValueError:
-            stock_start = 8
-            stock_end = 18
-            
-        return stock_start <= current_hour < stock_end
+    def should_push_stocks(self, hour: Optional[int] = None) -> bool:
+        """是否应该推送股票（hour默认为当前小时）"""
+        if hour is None:
+            hour = datetime.now().hour
+        return bool((self._stock_mask >> hour) & 1)
     
-    def should_push_news(self) -> bool:
-        """是否应该推送新闻"""
-        current_hour = datetime.now().hour
-        
-        # 从配置值中提取数字（处理可能包含注释的情况）
-        news_start_str = str(self.config.get("NEWS_PUSH_START", "8")).split()[0]  # 取第一个单词
-        news_end_str = str(self.config.get("NEWS_PUSH_END", "22")).split()[0]
-        
-        try:
-            news_start = int(news_start_str)
-            news_end = int(news_end_str)
-        except ValueError:
-            news_start = 8
-            news_end = 22
-            
-        return news_start <= current_hour < news_end
+    def should_push_news(self, hour: Optional[int] = None) -> bool:
+        """是否应该推送新闻（hour默认为当前小时）"""
+        if hour is None:
+            hour = datetime.now().hour
+        return bool((self._news_mask >> hour) & 1)
     
     def fetch_news(self) -> List[Dict[str, Any]]:
         """获取新闻"""
@@ -294,13 +440,14 @@ class NewPushSystem:
     
     def _get_mock_news(self) -> List[Dict[str, Any]]:
         """获取模拟新闻数据"""
+        published_at = datetime.now().strftime("%Y-%m-%d %H:%M:%S")
         return [
             {
                 "title": "测试新闻标题 1",
                 "summary": "这是测试新闻摘要 1",
                 "url": "https://example.com/news1",
                 "source": "测试源",
-                "published_at": datetime.now().strftime("%Y-%m-%d %H:%M:%S"),
+                "published_at": published_at,
                 "importance": "high"
             },
             {
@@ -308,7 +455,7 @@ class NewPushSystem:
                 "summary": "这是测试新闻摘要 2",
                 "url": "https://example.com/news2",
                 "source": "测试源",
-                "published_at": datetime.now().strftime("%Y-%m-%d %H:%M:%S"),
+                "published_at": published_at,
                 "importance": "medium"
             }
         ]
@@ -334,14 +481,24 @@ class NewPushSystem:
             }
         ]
     
-    def format_push_message(self, news: List[Dict], stocks: List[Dict], health_report: Dict[str, Any]) -> str:
-        """格式化推送消息"""
-        timestamp = datetime.now().strftime("%Y-%m-%d %H:%M:%S")
+    def format_push_message(self, news: List[Dict], stocks: List[Dict], health_report: Dict[str, Any],
+                            now: Optional[datetime] = None) -> str:
+        """格式化推送消息（now为推送时间，默认为当前时间）"""
+        if now is None:
+            now = datetime.now()
+        timestamp = now.strftime("%Y-%m-%d %H:%M:%S")
         
         # 健康状态emoji
         health_status = health_report.get("overall_status", "unknown")
         health_emoji = "✅" if health_status == "healthy" else "⚠️" if health_status == "warning" else "❌"
         
+        # 没有新闻和股票时只返回简短的标题信息
+        if not news and not stocks:
+            return (f"📰 智能新闻推送系统 (新版)\n"
+                    f"⏰ 推送时间: {timestamp}\n"
+                    f"🏥 系统状态: {health_emoji} {health_status}\n"
+                    f"(暂无推送内容)")
+        
         message_lines = []
         message_lines.append(f"📰 智能新闻推送系统 (新版)")
         message_lines.append(f"⏰ 推送时间: {timestamp}")
@@ -349,39 +506,39 @@ class NewPushSystem:
         message_lines.append("")
         
         # 股票部分
-        if stocks and self.should_push_stocks():
+        if stocks and self.should_push_stocks(now.hour):
             message_lines.append("📈 股票监控")
-            message_lines.append("-" * 30)
+            message_lines.append(_SEP)
             for stock in stocks[:3]:  # 限制显示3只股票
-                change_emoji = "📈" if stock.get("change", 0) >= 0 else "📉"
-                message_lines.append(f"{change_emoji} **{stock.get('name', '未知')}** ({stock.get('symbol', '未知')})")
-                message_lines.append(f"  价格: {stock.get('price', 0):.2f} {stock.get('currency', '')}")
-                message_lines.append(f"  涨跌: {stock.get('change', 0):+.2f} ({stock.get('change_percent', 0):+.2f}%)")
-                message_lines.append("")
+                # 每只股票生成一个文本块（末尾换行即原来的空行）
+                change = stock.get("change", 0)
+                change_emoji = _CHANGE_EMOJI[change >= 0]
+                message_lines.append(
+                    f"{change_emoji} **{stock.get('name', '未知')}** ({stock.get('symbol', '未知')})\n"
+                    f"  价格: {stock.get('price', 0):.2f} {stock.get('currency', '')}\n"
+                    f"  涨跌: {change:+.2f} ({stock.get('change_percent', 0):+.2f}%)\n"
+                )
         
         # 新闻部分
-        if news and self.should_push_news():
+        if news and self.should_push_news(now.hour):
             message_lines.append("📰 新闻摘要")
-            message_lines.append("-" * 30)
+            message_lines.append(_SEP)
             
-            for i, article in enumerate(news[:5]):  # 限制显示5条新闻
-                importance = article.get("importance", "medium")
-                importance_emoji = {
-                    "high": "🔴",
-                    "medium": "🟡",
-                    "low": "🟢"
-                }.get(importance, "⚪")
-                
-                message_lines.append(f"{importance_emoji} {article.get('title', '无标题')}")
-                if article.get("summary"):
-                    message_lines.append(f"  {article['summary'][:100]}...")
-                message_lines.append(f"  📅 {article.get('published_at', '未知时间')}")
-                message_lines.append(f"  🔗 {article.get('url', '无链接')}")
-                message_lines.append("")
+            for article in news[:5]:  # 限制显示5条新闻
+                # 每条新闻生成一个文本块（末尾换行即原来的空行）
+                importance_emoji = _IMPORTANCE_EMOJI.get(article.get("importance", "medium"), "⚪")
+                summary = article.get("summary")
+                summary_line = f"  {summary[:100]}...\n" if summary else ""
+                message_lines.append(
+                    f"{importance_emoji} {article.get('title', '无标题')}\n"
+                    f"{summary_line}"
+                    f"  📅 {article.get('published_at', '未知时间')}\n"
+                    f"  🔗 {article.get('url', '无链接')}\n"
+                )
         
         # 系统信息
         message_lines.append("🔧 系统信息")
-        message_lines.append("-" * 30)
+        message_lines.append(_SEP)
         message_lines.append(f"架构: situation-monitor v0.2.1")
         message_lines.append(f"新闻源: {len(news)} 条")
         message_lines.append(f"监控股票: {len(stocks)} 只")
@@ -407,8 +564,9 @@ class NewPushSystem:
             # 在实际系统中，这里应该调用:
             # send_whatsapp_message(self.config["WHATSAPP_NUMBER"], message)
             
-            # 模拟发送延迟
-            time.sleep(0.5)
+            # 模拟发送延迟（仅在设置SIMULATE_SEND_DELAY时）
+            if os.getenv("SIMULATE_SEND_DELAY"):
+                time.sleep(0.5)
             
             # 记录统计
             self.stats["successful_pushes"] += 1
@@ -423,50 +581,61 @@ class NewPushSystem:
         """运行完整推送流程"""
         self.logger.info(f"开始运行新版推送系统 (dry_run: {dry_run})")
         self.stats["runs"] += 1
-        self.stats["last_run"] = datetime.now().isoformat()
         
-        start_time = time.time()
+        # 本次运行统一使用同一个时间
+        now = datetime.now()
+        now_iso = now.isoformat()
+        self.stats["last_run"] = now_iso
         
-        # 1. 检查系统健康
-        health_report = self.check_system_health()
+        start_time = time.monotonic()
         
-        # 2. 获取数据
         news_data = []
         stock_data = []
-        
-        if self.should_push_news():
-            news_data = self.fetch_news()
-            self.stats["total_news_fetched"] += len(news_data)
-        
-        if self.should_push_stocks():
-            stock_data = self.fetch_stocks()
-            self.stats["total_stocks_fetched"] += len(stock_data)
-        
-        # 3. 格式化消息
-        push_message = self.format_push_message(news_data, stock_data, health_report)
-        
-        # 4. 发送消息
+        push_message = ""
         push_success = False
-        push_result = "未发送"
+        health_status = None
         
-        if not dry_run and (news_data or stock_data):
-            push_success, push_result = self.send_push_message(push_message)
+        push_news = self.should_push_news(now.hour)
+        push_stocks = self.should_push_stocks(now.hour)
+        
+        if not (push_news or push_stocks) and not dry_run:
+            # 不在任何推送时段内：跳过健康检查、数据获取和消息生成
+            push_result = "不在推送时段内，跳过推送"
         else:
-            push_result = f"干跑模式或无可推送数据 (新闻: {len(news_data)}, 股票: {len(stock_data)})"
+            # 1. 检查系统健康
+            health_report = self.check_system_health()
+            health_status = health_report.get("overall_status")
+            
+            # 2. 获取数据
+            if push_news:
+                news_data = self.fetch_news()
+                self.stats["total_news_fetched"] += len(news_data)
+            
+            if push_stocks:
+                stock_data = self.fetch_stocks()
+                self.stats["total_stocks_fetched"] += len(stock_data)
+            
+            # 3. 格式化消息
+            push_message = self.format_push_message(news_data, stock_data, health_report, now)
+            
+            # 4. 发送消息
+            if not dry_run and (news_data or stock_data):
+                push_success, push_result = self.send_push_message(push_message)
+            else:
+                push_result = f"干跑模式或无可推送数据 (新闻: {len(news_data)}, 股票: {len(stock_data)})"
         
         # 5. 计算耗时
-        elapsed_time = time.time() - start_time
-        self.stats["avg_response_time"] = (
-            self.stats["avg_response_time"] * (self.stats["runs"] - 1) + elapsed_time
-        ) / self.stats["runs"]
+        elapsed_time = time.monotonic() - start_time
+        # 增量均值：avg += (x - avg) / n
+        self.stats["avg_response_time"] += (elapsed_time - self.stats["avg_response_time"]) / self.stats["runs"]
         
         # 6. 生成结果
         result = {
             "success": push_success,
             "dry_run": dry_run,
-            "timestamp": datetime.now().isoformat(),
+            "timestamp": now_iso,
             "elapsed_time": elapsed_time,
-            "health_status": health_report.get("overall_status"),
+            "health_status": health_status,
             "news_count": len(news_data),
             "stock_count": len(stock_data),
             "push_result": push_result,
@@ -483,26 +652,35 @@ class NewPushSystem:
         return result
     
     def _save_run_log(self, result: Dict[str, Any]):
-        """保存运行日志"""
-        try:
-            log_dir = "./logs"
-            os.makedirs(log_dir, exist_ok=True)
-            
-            timestamp = datetime.now().strftime("%Y%m%d_%H%M%S")
-            log_file = os.path.join(log_dir, f"new_push_system_{timestamp}.json")
-            
-            with open(log_file, 'w', encoding='utf-8') as f:
-                json.dump(result, f, indent=2, ensure_ascii=False)
-            
-            self.logger.info(f"运行日志已保存: {log_file}")
-        except Exception as e:
-            self.logger.error(f"保存运行日志失败: {e}")
+        """保存运行日志（先写入缓冲，达到RUN_LOG_FLUSH_THRESHOLD条时写入文件）"""
+        line = None
+        if ORJSON_AVAILABLE:
+            try:
+                line = orjson.dumps(result)
+            except orjson.JSONEncodeError:
+                # 非字符串键等orjson不支持的内容，改用json序列化
+                line = None
+        
+        if line is None:
+            try:
+                line = json.dumps(result, ensure_ascii=False, default=str).encode("utf-8")
+            except Exception as e:
+                self.logger.error(f"保存运行日志失败: {e}")
+                return
+        
+        self._log_buffer.append(line)
+        if len(self._log_buffer) >= RUN_LOG_FLUSH_THRESHOLD:
+            self.flush_run_logs()
+    
+    def flush_run_logs(self):
+        """将缓冲的运行日志追加写入日志文件"""
+        _append_run_log(self._log_path, self._log_buffer, self.logger)
     
     def get_stats(self) -> Dict[str, Any]:
         """获取统计信息"""
         return {
             **self.stats,
-            "uptime": time.time() - self.start_time,
+            "uptime": time.monotonic() - self._start_monotonic,
             "success_rate": (
                 self.stats["successful_pushes"] / max(self.stats["runs"], 1)
             ) * 100
@@ -525,7 +703,8 @@ def main():
     print("=" * 60)
     
     try:
-        push_system = NewPushSystem(enable_whatsapp=True)
+        # 只查看统计时不加载监控和推送组件
+        push_system = NewPushSystem(enable_whatsapp=True, load_components=not args.stats)
         
         if args.stats:
             stats = push_system.get_stats()